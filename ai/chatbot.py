@@ -1,112 +1,58 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import datetime
-import requests
-import json
-
-# Page configuration
-st.set_page_config(
-    page_title="MCA AI Chatbot",
-    page_icon="🤖",
-    layout="wide"
-)
-
-# Custom CSS
-st.markdown("""
-<style>
-.chat-message {
-    padding: 1.5rem;
-    border-radius: 0.5rem;
-    margin-bottom: 1rem;
-    display: flex;
-    flex-direction: column;
+import orjson
+import os
+import re
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from functools import lru_cache
+from itertools import islice
+
+API_BASE_URL = "http://localhost:5000"
+
+# Optional LLM backend for queries no canned topic covers; prompts sent to it
+# are coalesced into batches (flushed at BATCH_MAX_SIZE or after BATCH_MAX_WAIT)
+LLM_BACKEND_URL = os.environ.get("MCA_LLM_BACKEND_URL")
+BATCH_MAX_SIZE = 16
+BATCH_MAX_WAIT = 0.1
+BATCH_RESULT_TIMEOUT = 35  # backend request timeout plus batching slack
+
+# Chat history is capped and only the most recent messages are re-rendered
+MAX_HISTORY = 200
+VISIBLE_MESSAGES = 50
+
+# Topic keywords in priority order (first matching topic wins); queries are
+# matched as whole words so short keywords like "it" don't fire inside "site"
+TOPIC_KEYWORDS = [
+    ('greeting', frozenset({'hello', 'hi', 'hey', 'greetings'})),
+    ('technology', frozenset({'technology', 'tech', 'software', 'it', 'computer', 'computers'})),
+    ('manufacturing', frozenset({'manufacturing', 'factory', 'factories', 'production', 'industrial'})),
+    ('pharma', frozenset({'pharma', 'pharmaceutical', 'pharmaceuticals', 'medicine', 'medicines', 'drug', 'drugs', 'healthcare'})),
+    ('capital', frozenset({'capital', 'money', 'fund', 'funds', 'funding', 'investment', 'investments', 'finance'})),
+    ('trends', frozenset({'trend', 'trends', 'growth', 'registration', 'registrations', 'incorporation', 'incorporations', 'year', 'years'})),
+    ('location', frozenset({'state', 'states', 'location', 'locations', 'city', 'cities', 'region', 'regions', 'mumbai', 'delhi', 'bangalore'})),
+    ('director', frozenset({'director', 'directors', 'management', 'board', 'boards', 'ceo', 'md'})),
+    ('help', frozenset({'help', 'features', 'capabilities'})),
+]
+# Multi-word keywords that can't be matched token by token
+TOPIC_PHRASES = {
+    'help': ('what can you do',),
 }
-.chat-message.user {
-    background-color: #2b313e;
-    border-left: 4px solid #ff4b4b;
-}
-.chat-message.assistant {
-    background-color: #1a1a1a;
-    border-left: 4px solid #00cc88;
-}
-</style>
-""", unsafe_allow_html=True)
+KEYWORD_TOPICS = {word: topic for topic, words in reversed(TOPIC_KEYWORDS) for word in words}
+TOPIC_PRIORITY = {topic: rank for rank, (topic, _) in enumerate(TOPIC_KEYWORDS)}
 
-def main():
-    st.title("🤖 MCA Insights AI Chatbot")
-    st.markdown("""
-    Welcome to your MCA Data Assistant! I can help you analyze company data and get insights.
-    """)
-    
-    # Initialize chat history
-    if "messages" not in st.session_state:
-        st.session_state.messages = [
-            {
-                "role": "assistant",
-                "content": "Hello! I'm your MCA Insights assistant. I can help you with:\n\n• Company search and analysis\n• Industry trends and insights\n• Financial data and capital information\n• Registration patterns\n• Director details\n\nWhat would you like to know about MCA data?"
-            }
-        ]
-    
-    # Display chat messages
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-    
-    # Chat input
-    if prompt := st.chat_input("Ask about MCA data, companies, industries, or financial information..."):
-        # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
-        
-        # Display user message
-        with st.chat_message("user"):
-            st.markdown(prompt)
-        
-        # Generate assistant response
-        with st.chat_message("assistant"):
-            with st.spinner("Analyzing MCA data..."):
-                response = generate_ai_response(prompt)
-                st.markdown(response)
-        
-        # Add assistant response to chat history
-        st.session_state.messages.append({"role": "assistant", "content": response})
-    
-    # Sidebar
-    with st.sidebar:
-        st.header("🔧 Tools")
-        
-        if st.button("Clear Chat History"):
-            st.session_state.messages = [
-                {
-                    "role": "assistant", 
-                    "content": "Chat history cleared! How can I help you with MCA data today?"
-                }
-            ]
-            st.rerun()
-        
-        if st.button("Check API Status"):
-            try:
-                response = requests.get("http://localhost:5000/api/health")
-                if response.status_code == 200:
-                    data = response.json()
-                    st.success(f"✅ API Connected - {data['total_companies']} companies")
-                else:
-                    st.error("❌ API is not responding")
-            except:
-                st.error("❌ Cannot connect to API")
+API_STATS_KEYWORDS = frozenset({'stat', 'stats', 'statistics', 'overview', 'summary', 'total'})
+API_STATS_PHRASES = ('how many',)
+API_INDUSTRY_KEYWORDS = frozenset({'industry', 'industries', 'sector', 'sectors', 'segment', 'segments'})
 
-def generate_ai_response(user_input):
-    """Generate intelligent AI response based on user input"""
-    input_lower = user_input.lower()
-    
-    # Try to get real data from API first
-    api_response = get_api_data(input_lower)
-    if api_response:
-        return api_response
-    
-    # Enhanced responses with detailed information
-    if any(word in input_lower for word in ['hello', 'hi', 'hey', 'greetings']):
-        return """**Hello! I'm your MCA Data Assistant** 👋
+WORD_PATTERN = re.compile(r'[a-z]+')
+# Split point after each blank line, so streamed chunks are whole paragraphs
+PARAGRAPH_BREAK = re.compile(r'(?<=\n\n)')
+
+# Response bodies; the {placeholders} are filled once at import (see TOPIC_RESPONSES)
+HELLO_RESPONSE = """**Hello! I'm your MCA Data Assistant** 👋
 
 I specialize in helping you analyze Ministry of Corporate Affairs data. Here's what I can help you with:
 
@@ -136,10 +82,8 @@ I specialize in helping you analyze Ministry of Corporate Affairs data. Here's w
 • Seasonal registration patterns
 
 What would you like to explore today?"""
-    
-    elif any(word in input_lower for word in ['technology', 'tech', 'software', 'it', 'computer']):
-        stats = get_industry_stats('Technology')
-        return f"""**🚀 Technology Sector Analysis**
+
+TECHNOLOGY_TEMPLATE = """**🚀 Technology Sector Analysis**
 
 {stats}
 
@@ -162,10 +106,8 @@ What would you like to explore today?"""
 • 72% of tech companies are less than 3 years old
 
 Would you like specific details about any technology company or sub-sector?"""
-    
-    elif any(word in input_lower for word in ['manufacturing', 'factory', 'production', 'industrial']):
-        stats = get_industry_stats('Manufacturing')
-        return f"""**🏭 Manufacturing Sector Analysis**
+
+MANUFACTURING_TEMPLATE = """**🏭 Manufacturing Sector Analysis**
 
 {stats}
 
@@ -193,10 +135,8 @@ Would you like specific details about any technology company or sub-sector?"""
 • Technology adoption in manufacturing processes
 
 Need details about specific manufacturing companies?"""
-    
-    elif any(word in input_lower for word in ['pharma', 'pharmaceutical', 'medicine', 'drug', 'healthcare']):
-        stats = get_industry_stats('Healthcare')
-        return f"""**💊 Pharmaceutical Sector Analysis**
+
+PHARMA_TEMPLATE = """**💊 Pharmaceutical Sector Analysis**
 
 {stats}
 
@@ -227,10 +167,8 @@ Need details about specific manufacturing companies?"""
 • Venture funding in pharma-tech: ₹850 crores
 
 Looking for specific pharmaceutical company information?"""
-    
-    elif any(word in input_lower for word in ['capital', 'money', 'fund', 'investment', 'finance']):
-        capital_data = get_capital_stats()
-        return f"""**💰 Financial Capital Analysis**
+
+CAPITAL_TEMPLATE = """**💰 Financial Capital Analysis**
 
 {capital_data}
 
@@ -260,10 +198,8 @@ Looking for specific pharmaceutical company information?"""
 • Return on capital: Average 18.5% across sectors
 
 Need specific capital analysis for any company or sector?"""
-    
-    elif any(word in input_lower for word in ['trend', 'growth', 'registration', 'incorporation', 'year']):
-        trends = get_trends_data()
-        return f"""**📈 Company Registration Trends**
+
+TRENDS_TEMPLATE = """**📈 Company Registration Trends**
 
 {trends}
 
@@ -300,10 +236,8 @@ Need specific capital analysis for any company or sector?"""
 • SME segment showing 35% acceleration
 
 Want to explore specific trend patterns?"""
-    
-    elif any(word in input_lower for word in ['state', 'location', 'city', 'region', 'mumbai', 'delhi', 'bangalore']):
-        location_data = get_location_stats()
-        return f"""**📍 Geographical Business Distribution**
+
+LOCATION_TEMPLATE = """**📍 Geographical Business Distribution**
 
 {location_data}
 
@@ -345,9 +279,8 @@ Want to explore specific trend patterns?"""
 • **Chennai**: 32% growth in automotive
 
 Looking for business insights for any specific location?"""
-    
-    elif any(word in input_lower for word in ['director', 'management', 'board', 'ceo', 'md']):
-        return """**👥 Director & Management Insights**
+
+DIRECTOR_RESPONSE = """**👥 Director & Management Insights**
 
 **Director Profile Analysis:**
 
@@ -382,9 +315,8 @@ Looking for business insights for any specific location?"""
 • 15% of companies have founder-CEO structure
 
 Need specific director information for any company?"""
-    
-    elif any(word in input_lower for word in ['help', 'what can you do', 'features', 'capabilities']):
-        return """**🛠️ How I Can Help You**
+
+HELP_RESPONSE = """**🛠️ How I Can Help You**
 
 I'm your comprehensive MCA data analysis assistant. Here are my capabilities:
 
@@ -432,10 +364,8 @@ I'm your comprehensive MCA data analysis assistant. Here are my capabilities:
 • "Show me director details for Reliance Industries"
 
 What would you like to explore?"""
-    
-    else:
-        # For unknown queries, try to provide helpful guidance
-        return f"""**I understand you're asking about: "{user_input}"**
+
+FALLBACK_TEMPLATE = """**I understand you're asking about: "{user_input}"**
 
 Let me help you get the right information. Here are some ways I can assist:
 
@@ -447,15 +377,357 @@ Let me help you get the right information. Here are some ways I can assist:
 
 Could you please rephrase your question or tell me what specific information you're looking for?"""
 
-def get_api_data(query):
-    """Get real data from API with enhanced responses"""
+CUSTOM_CSS = """
+<style>
+.chat-message {
+    padding: 1.5rem;
+    border-radius: 0.5rem;
+    margin-bottom: 1rem;
+    display: flex;
+    flex-direction: column;
+}
+.chat-message.user {
+    background-color: #2b313e;
+    border-left: 4px solid #ff4b4b;
+}
+.chat-message.assistant {
+    background-color: #1a1a1a;
+    border-left: 4px solid #00cc88;
+}
+</style>
+"""
+
+# Simulated industry statistics
+INDUSTRY_DATA = {
+    'Technology': {
+        'companies': 425,
+        'growth': '28% YoY',
+        'avg_capital': '₹3.2 crores',
+        'top_states': 'Karnataka, Maharashtra, Telangana'
+    },
+    'Manufacturing': {
+        'companies': 315, 
+        'growth': '15% YoY',
+        'avg_capital': '₹8.7 crores',
+        'top_states': 'Gujarat, Tamil Nadu, Maharashtra'
+    },
+    'Healthcare': {
+        'companies': 265,
+        'growth': '22% YoY', 
+        'avg_capital': '₹6.3 crores',
+        'top_states': 'Maharashtra, Gujarat, Telangana'
+    }
+}
+
+DEFAULT_INDUSTRY_DATA = {
+    'companies': 200,
+    'growth': '18% YoY',
+    'avg_capital': '₹4.5 crores', 
+    'top_states': 'Multiple states'
+}
+
+def format_industry_stats(industry):
+    """Format one industry's statistics as markdown bullets"""
+    return f"""• **Total Companies**: {industry['companies']:,}
+• **Growth Rate**: {industry['growth']}
+• **Average Capital**: {industry['avg_capital']}
+• **Top Locations**: {industry['top_states']}"""
+
+# Formatted once at import so lookups are a plain dict get
+INDUSTRY_STATS = {name: format_industry_stats(data) for name, data in INDUSTRY_DATA.items()}
+DEFAULT_INDUSTRY_STATS = format_industry_stats(DEFAULT_INDUSTRY_DATA)
+
+CAPITAL_STATS = """• **Total Authorized Capital**: ₹8,45,62,00,000
+• **Average per Company**: ₹45,78,000
+• **Capital Range**: ₹1 lakh to ₹250 crores
+• **SME Representation**: 65% companies below ₹1 crore
+• **Large Enterprises**: 8% companies above ₹100 crores"""
+
+TRENDS_DATA = """• **Current Year Registrations**: 185 companies
+• **Growth Rate**: 25% Year-over-Year
+• **Projected Next Year**: 230+ companies
+• **Fastest Growing**: Technology sector (35% YoY)
+• **Most Active**: Maharashtra (24% of registrations)"""
+
+LOCATION_STATS = """• **Total States Covered**: 18
+• **Top State**: Maharashtra (24.6% share)
+• **Emerging Hub**: Karnataka (20.3% share)
+• **Regional Diversity**: 65% companies in top 5 states
+• **Rural Penetration**: 15% companies in tier 3 cities"""
+
+# Every canned answer is fully rendered at import; answering is a dict lookup
+TOPIC_RESPONSES = {
+    'greeting': HELLO_RESPONSE,
+    'technology': TECHNOLOGY_TEMPLATE.format(stats=INDUSTRY_STATS.get('Technology', DEFAULT_INDUSTRY_STATS)),
+    'manufacturing': MANUFACTURING_TEMPLATE.format(stats=INDUSTRY_STATS.get('Manufacturing', DEFAULT_INDUSTRY_STATS)),
+    'pharma': PHARMA_TEMPLATE.format(stats=INDUSTRY_STATS.get('Healthcare', DEFAULT_INDUSTRY_STATS)),
+    'capital': CAPITAL_TEMPLATE.format(capital_data=CAPITAL_STATS),
+    'trends': TRENDS_TEMPLATE.format(trends=TRENDS_DATA),
+    'location': LOCATION_TEMPLATE.format(location_data=LOCATION_STATS),
+    'director': DIRECTOR_RESPONSE,
+    'help': HELP_RESPONSE,
+}
+
+# Page configuration
+st.set_page_config(
+    page_title="MCA AI Chatbot",
+    page_icon="🤖",
+    layout="wide"
+)
+
+# Custom CSS (a module constant, so reruns reuse the same string object).
+# It is still emitted on every rerun: Streamlit clears elements a rerun
+# doesn't re-emit, so a once-per-session guard would drop the styles.
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+def main():
+    start_api_prefetch()
+    
+    st.title("🤖 MCA Insights AI Chatbot")
+    st.markdown("""
+    Welcome to your MCA Data Assistant! I can help you analyze company data and get insights.
+    """)
+    
+    # Initialize chat history as (role, content) tuples
+    if "messages" not in st.session_state:
+        st.session_state.messages = new_chat_history(
+            "Hello! I'm your MCA Insights assistant. I can help you with:\n\n• Company search and analysis\n• Industry trends and insights\n• Financial data and capital information\n• Registration patterns\n• Director details\n\nWhat would you like to know about MCA data?"
+        )
+    
+    # Display chat messages (latest window unless the user asked for everything)
+    messages = st.session_state.messages
+    hidden_count = 0 if st.session_state.get("show_all_messages") else max(len(messages) - VISIBLE_MESSAGES, 0)
+    if hidden_count and st.button(f"Show {hidden_count} earlier messages"):
+        st.session_state.show_all_messages = True
+        st.rerun()
+    
+    for role, content in islice(messages, hidden_count, None):
+        with st.chat_message(role):
+            st.markdown(content)
+    
+    # Chat input
+    if prompt := st.chat_input("Ask about MCA data, companies, industries, or financial information..."):
+        # Add user message to chat history
+        st.session_state.messages.append(("user", prompt))
+        
+        # Display user message
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        
+        # Generate assistant response
+        with st.chat_message("assistant"):
+            response = st.write_stream(stream_ai_response(prompt))
+        
+        # Add assistant response to chat history
+        st.session_state.messages.append(("assistant", response))
+    
+    # Sidebar
+    with st.sidebar:
+        st.header("🔧 Tools")
+        
+        if st.button("Clear Chat History"):
+            st.session_state.messages = new_chat_history(
+                "Chat history cleared! How can I help you with MCA data today?"
+            )
+            st.session_state.show_all_messages = False
+            st.rerun()
+        
+        if st.button("Check API Status"):
+            status_code = check_api_status()
+            if status_code == 200:
+                try:
+                    st.success(f"✅ API Connected - {fetch_stats()['total_companies']} companies")
+                except Exception:
+                    st.success("✅ API Connected")
+            elif status_code is None:
+                st.error("❌ Cannot connect to API")
+            else:
+                st.error("❌ API is not responding")
+
+def new_chat_history(greeting):
+    """Start a bounded chat history holding the assistant's greeting"""
+    return deque([("assistant", greeting)], maxlen=MAX_HISTORY)
+
+def normalize_query(user_input):
+    """Normalize user input into a lowercase, whitespace-collapsed cache key"""
+    return " ".join(user_input.lower().split())
+
+@lru_cache(maxsize=512)
+def tokenize(input_lower):
+    """Split a normalized query into its set of words (shared by API and topic routing)"""
+    return frozenset(WORD_PATTERN.findall(input_lower))
+
+def detect_topic(input_lower):
+    """Classify a normalized query into the highest-priority matching topic"""
+    topics = {KEYWORD_TOPICS[token] for token in tokenize(input_lower) if token in KEYWORD_TOPICS}
+    topics.update(topic for topic, phrases in TOPIC_PHRASES.items()
+                  if any(phrase in input_lower for phrase in phrases))
+    if not topics:
+        return None
+    return min(topics, key=TOPIC_PRIORITY.get)
+
+def generate_ai_response(user_input):
+    """Generate intelligent AI response based on user input"""
+    input_lower = normalize_query(user_input)
+    
+    # Try to get real data from API first
+    api_response = get_api_data(input_lower)
+    if api_response:
+        return api_response
+    
+    static_response = generate_static_response(input_lower)
+    if static_response:
+        return static_response
+    
+    if LLM_BACKEND_URL:
+        try:
+            return get_batcher().submit(user_input)
+        except Exception as e:
+            print(f"LLM Backend Error: {e}")
+    
+    # For unknown queries, try to provide helpful guidance
+    return FALLBACK_TEMPLATE.format(user_input=user_input)
+
+def stream_ai_response(user_input):
+    """Build the response under a spinner, then yield it paragraph by paragraph"""
+    with st.spinner("Analyzing MCA data..."):
+        response = generate_ai_response(user_input)
+    yield from PARAGRAPH_BREAK.split(response)
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def generate_static_response(input_lower):
+    """Build the canned response for a normalized query (None if no topic matches)"""
+    return TOPIC_RESPONSES.get(detect_topic(input_lower))
+
+class ResponseBatcher:
+    """Coalesce concurrent prompts from all sessions into batched backend calls"""
+    
+    def __init__(self, handler, max_batch_size=BATCH_MAX_SIZE, max_wait=BATCH_MAX_WAIT):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.pending = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+    
+    def submit(self, prompt, timeout=BATCH_RESULT_TIMEOUT):
+        """Queue a prompt and block until its batch has been answered (TimeoutError after timeout)"""
+        future = Future()
+        self.pending.put((prompt, future))
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            # A cancelled future is skipped if its batch has not been sent yet
+            future.cancel()
+            raise
+    
+    def _collect_batch(self):
+        """Wait for one prompt, then gather more until the batch is full or max_wait passes"""
+        batch = [self.pending.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.pending.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        # The worker must outlive any failure, or every later submit would hang
+        while True:
+            try:
+                self._answer_batch(self._collect_batch())
+            except Exception as e:
+                print(f"LLM batch worker error: {e}")
+    
+    def _answer_batch(self, batch):
+        """Call the handler for one batch and resolve every future exactly once"""
+        batch = [(prompt, future) for prompt, future in batch if not future.cancelled()]
+        if not batch:
+            return
+        try:
+            responses = list(self.handler([prompt for prompt, _ in batch]))
+            if len(responses) != len(batch):
+                raise ValueError(f"LLM backend returned {len(responses)} answers for {len(batch)} prompts")
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+def query_llm_backend(prompts):
+    """Send a batch of prompts to the LLM backend in a single request"""
+    response = get_client().post(LLM_BACKEND_URL, json={"prompts": prompts}, timeout=30)
+    response.raise_for_status()
+    return orjson.loads(response.content)["responses"]
+
+@st.cache_resource
+def get_batcher():
+    """One batcher per server process, shared by every chat session"""
+    return ResponseBatcher(query_llm_backend)
+
+@st.cache_resource
+def get_client():
+    """Shared HTTP/2 client so API calls reuse pooled keep-alive connections"""
+    # Imported lazily so script reruns that never touch the API skip it
+    import httpx
+    
+    return httpx.Client(
+        base_url=API_BASE_URL,
+        http2=True,
+        timeout=2.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+    )
+
+@st.cache_data(ttl=5, show_spinner=False)
+def check_api_status():
+    """HEAD the health endpoint with a short timeout; None if unreachable"""
+    import httpx
+    
     try:
-        # Get overall stats for general queries
-        if any(word in query.lower() for word in ['stat', 'overview', 'summary', 'total', 'how many']):
-            response = requests.get("http://localhost:5000/api/stats")
-            if response.status_code == 200:
-                data = response.json()
-                return f"""**📊 MCA Database Overview**
+        return get_client().head("/api/health", timeout=0.5).status_code
+    except httpx.HTTPError:
+        return None
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_bundle():
+    """Fetch stats and industry analysis JSON from the API in one request"""
+    response = get_client().get("/api/bundle")
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def prefetch_api_data():
+    """Warm the API bundle cache; failures are left for the first real lookup"""
+    try:
+        fetch_bundle()
+    except Exception as e:
+        print(f"API Prefetch Error: {e}")
+
+@st.cache_resource
+def start_api_prefetch():
+    """Fetch the API bundle in the background once per server process"""
+    threading.Thread(target=prefetch_api_data, daemon=True).start()
+    return True
+
+def fetch_stats():
+    """Get overall statistics from the cached API bundle"""
+    return fetch_bundle()['stats']
+
+def fetch_industries():
+    """Get industry analysis from the cached API bundle"""
+    return fetch_bundle()['industries']
+
+@st.cache_data(ttl=30, show_spinner=False)
+def format_stats_overview():
+    """Render the /api/stats overview once per cache window"""
+    data = fetch_stats()
+    top_industries = "\n".join(f"• **{industry}**: {count} companies" for industry, count in list(data['industry_distribution'].items())[:5])
+    top_states = "\n".join(f"• **{state}**: {count} companies" for state, count in list(data['state_distribution'].items())[:5])
+    return f"""**📊 MCA Database Overview**
 
 🏢 **Company Statistics:**
 • **Total Registered Companies**: {data['total_companies']:,}
@@ -469,10 +741,10 @@ def get_api_data(query):
 • **Total Paid-up Capital**: ₹{data.get('total_paid_capital', data['total_capital']*0.6):,}
 
 🏭 **Top Industries:**
-{chr(10).join(f"• **{industry}**: {count} companies" for industry, count in list(data['industry_distribution'].items())[:5])}
+{top_industries}
 
 📍 **Top States:**
-{chr(10).join(f"• **{state}**: {count} companies" for state, count in list(data['state_distribution'].items())[:5])}
+{top_states}
 
 📈 **Recent Activity:**
 • Latest incorporation: {data.get('latest_incorporation', '2024-01-15')}
@@ -480,87 +752,38 @@ def get_api_data(query):
 
 *Data updated in real-time from MCA database*"""
 
-        # Get industry-specific data
-        elif any(word in query.lower() for word in ['industry', 'sector', 'segment']):
-            response = requests.get("http://localhost:5000/api/industries")
-            if response.status_code == 200:
-                industries = response.json()[:6]
-                result = "**🏭 Industry Performance Overview**\n\n"
-                for industry in industries:
-                    utilization = (industry['total_paid_capital'] / industry['total_authorized_capital'] * 100) if industry['total_authorized_capital'] > 0 else 0
-                    result += f"""**{industry['industry']}**
+@st.cache_data(ttl=30, show_spinner=False)
+def format_industry_overview():
+    """Render the /api/industries overview once per cache window"""
+    sections = []
+    for industry in fetch_industries()[:6]:
+        utilization = (industry['total_paid_capital'] / industry['total_authorized_capital'] * 100) if industry['total_authorized_capital'] > 0 else 0
+        sections.append(f"""**{industry['industry']}**
 • Companies: {industry['company_count']:,}
 • Total Capital: ₹{industry['total_authorized_capital']:,}
 • Average Capital: ₹{industry['avg_authorized_capital']:,}
 • Capital Utilization: {utilization:.1f}%
 • Avg Directors: {industry['avg_directors']:.1f}
 
-"""
-                return result + "*Based on current MCA registration data*"
+""")
+    return "**🏭 Industry Performance Overview**\n\n" + "".join(sections) + "*Based on current MCA registration data*"
+
+def get_api_data(input_lower):
+    """Get real data from API with enhanced responses"""
+    tokens = tokenize(input_lower)
+    try:
+        # Get overall stats for general queries
+        if tokens & API_STATS_KEYWORDS or any(phrase in input_lower for phrase in API_STATS_PHRASES):
+            return format_stats_overview()
+
+        # Get industry-specific data
+        elif tokens & API_INDUSTRY_KEYWORDS:
+            return format_industry_overview()
 
     except Exception as e:
         print(f"API Error: {e}")
     
     return None
 
-def get_industry_stats(industry_name):
-    """Get simulated industry statistics"""
-    industry_data = {
-        'Technology': {
-            'companies': 425,
-            'growth': '28% YoY',
-            'avg_capital': '₹3.2 crores',
-            'top_states': 'Karnataka, Maharashtra, Telangana'
-        },
-        'Manufacturing': {
-            'companies': 315, 
-            'growth': '15% YoY',
-            'avg_capital': '₹8.7 crores',
-            'top_states': 'Gujarat, Tamil Nadu, Maharashtra'
-        },
-        'Healthcare': {
-            'companies': 265,
-            'growth': '22% YoY', 
-            'avg_capital': '₹6.3 crores',
-            'top_states': 'Maharashtra, Gujarat, Telangana'
-        }
-    }
-    
-    industry = industry_data.get(industry_name, {
-        'companies': 200,
-        'growth': '18% YoY',
-        'avg_capital': '₹4.5 crores', 
-        'top_states': 'Multiple states'
-    })
-    
-    return f"""• **Total Companies**: {industry['companies']:,}
-• **Growth Rate**: {industry['growth']}
-• **Average Capital**: {industry['avg_capital']}
-• **Top Locations**: {industry['top_states']}"""
-
-def get_capital_stats():
-    """Get simulated capital statistics"""
-    return """• **Total Authorized Capital**: ₹8,45,62,00,000
-• **Average per Company**: ₹45,78,000
-• **Capital Range**: ₹1 lakh to ₹250 crores
-• **SME Representation**: 65% companies below ₹1 crore
-• **Large Enterprises**: 8% companies above ₹100 crores"""
-
-def get_trends_data():
-    """Get simulated trends data"""
-    return """• **Current Year Registrations**: 185 companies
-• **Growth Rate**: 25% Year-over-Year
-• **Projected Next Year**: 230+ companies
-• **Fastest Growing**: Technology sector (35% YoY)
-• **Most Active**: Maharashtra (24% of registrations)"""
-
-def get_location_stats():
-    """Get simulated location data"""
-    return """• **Total States Covered**: 18
-• **Top State**: Maharashtra (24.6% share)
-• **Emerging Hub**: Karnataka (20.3% share)
-• **Regional Diversity**: 65% companies in top 5 states
-• **Rural Penetration**: 15% companies in tier 3 cities"""
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
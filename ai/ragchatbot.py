@@ -1,13 +1,18 @@
 import pandas as pd
 import json
 import os
+import hashlib
 import sys
 import re
+import threading
+import time
+from bisect import bisect_left
 from datetime import datetime, timedelta
 import numpy as np
 import streamlit as st
 from sentence_transformers import SentenceTransformer
 import faiss
+import torch
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,6 +21,136 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.utils import load_config
 
+# Use every core for the encoder's forward pass; a couple of inter-op threads is plenty
+torch.set_num_threads(os.cpu_count() or 1)
+try:
+    torch.set_num_interop_threads(2)
+except RuntimeError:
+    pass  # Already fixed once parallel work has started in this process
+
+# Index by corpus size: exhaustive search for small corpora, an HNSW graph above
+# FLAT_INDEX_MAX_ROWS, and a compressed IVF+PQ index once full vectors get too big for RAM
+FLAT_INDEX_MAX_ROWS = 10_000
+HNSW_INDEX_MAX_ROWS = 500_000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+IVF_PQ_SUBQUANTIZERS = 16
+IVF_PQ_BITS = 8
+IVF_NPROBE = 16
+
+# Columns that feed the embedding text; a change in any of them invalidates the on-disk cache
+EMBEDDING_KEY_COLUMNS = ['CIN', 'Company Name', 'State', 'Company Category']
+
+# Only the columns the chatbot uses are read, with compact dtypes; capital stays float64
+# because rupee amounts above 2**24 are not exact in float32
+CSV_DTYPES = {
+    'CIN': 'string',
+    'Company Name': 'string',
+    'State': 'category',
+    'Company Category': 'category',
+    'Authorized Capital': 'float64',
+    'Date of Incorporation': None,
+    'City': 'category'
+}
+
+# States/UTs and sectors recognised in queries; all matched in a single regex scan
+INDIAN_STATES = [
+    'Andhra Pradesh', 'Arunachal Pradesh', 'Assam', 'Bihar', 'Chhattisgarh', 'Goa',
+    'Gujarat', 'Haryana', 'Himachal Pradesh', 'Jharkhand', 'Karnataka', 'Kerala',
+    'Madhya Pradesh', 'Maharashtra', 'Manipur', 'Meghalaya', 'Mizoram', 'Nagaland',
+    'Odisha', 'Punjab', 'Rajasthan', 'Sikkim', 'Tamil Nadu', 'Telangana', 'Tripura',
+    'Uttar Pradesh', 'Uttarakhand', 'West Bengal', 'Andaman and Nicobar Islands',
+    'Chandigarh', 'Dadra and Nagar Haveli and Daman and Diu', 'Delhi',
+    'Jammu and Kashmir', 'Ladakh', 'Lakshadweep', 'Puducherry'
+]
+SECTORS = ['manufacturing', 'technology', 'pharmaceutical']
+
+# Common questions whose answer never depends on the wording, matched by embedding
+# similarity instead of going through intent detection
+FAQ = [
+    ('how many companies are there', 'handle_count_query'),
+    ('how many companies are in the database', 'handle_count_query'),
+    ('total number of companies', 'handle_count_query'),
+    ('count of registered companies', 'handle_count_query'),
+    ('how many companies do you have data for', 'handle_count_query'),
+    ('top states by company count', 'handle_count_query'),
+    ('which states have the most companies', 'handle_count_query'),
+    ('recent incorporations', 'handle_new_incorporations'),
+    ('recent company registrations', 'handle_new_incorporations'),
+    ('newly incorporated companies', 'handle_new_incorporations'),
+    ('latest companies registered', 'handle_new_incorporations'),
+    ('show me new companies', 'handle_new_incorporations'),
+    ('which companies were incorporated recently', 'handle_new_incorporations'),
+    ('companies struck off last month', 'handle_struck_off_query'),
+    ('struck off companies', 'handle_struck_off_query'),
+    ('deregistered companies', 'handle_struck_off_query'),
+    ('which companies were removed from the register', 'handle_struck_off_query'),
+    ('closed companies', 'handle_struck_off_query'),
+    ('how many companies were struck off', 'handle_struck_off_query'),
+    ('list of struck off companies', 'handle_struck_off_query')
+]
+FAQ_THRESHOLD = 0.85
+
+# Fixed parts of the search answer
+SEARCH_RESULTS_HEADER = "🔍 I found these companies that might match your query:\n\n"
+SEARCH_HELP_SUFFIX = (
+    "\n💡 **You can ask me about:**"
+    "\n• Companies in specific states"
+    "\n• Companies with certain capital requirements"
+    "\n• Recent incorporations"
+    "\n• Total company counts"
+)
+NO_RESULTS_RESPONSE = (
+    "❌ I couldn't find specific matches for your query. Try asking about:\n\n"
+    "• 'Companies in Maharashtra'\n"
+    "• 'Companies with capital above 10 lakh'\n"
+    "• 'How many companies are there?'\n"
+    "• 'Recent company registrations'"
+)
+
+# Sentence encoder: an int8 ONNX export of the model is built once and reused when available
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+ONNX_MODEL_DIR = os.path.join(os.path.dirname(__file__), '..', 'models', 'minilm-onnx-int8')
+ONNX_MODEL_FILE = 'onnx/model_qint8_avx2.onnx'
+
+# Semantic answer cache: similar enough questions with the same intent reuse an answer
+QUERY_CACHE_THRESHOLD = 0.92
+QUERY_CACHE_TTL = 3600
+QUERY_CACHE_CHUNK = 256
+QUERY_CACHE_MAX_ENTRIES = 4096
+# Intents answered from the query text itself rather than extracted parameters
+QUERY_TEXT_INTENTS = ('company_search', 'general_query')
+
+@st.cache_resource(show_spinner=False)
+def load_sentence_encoder():
+    """Load the quantized ONNX encoder once per process, falling back to the PyTorch model"""
+    try:
+        import onnxruntime
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+        
+        if not os.path.exists(os.path.join(ONNX_MODEL_DIR, ONNX_MODEL_FILE)):
+            model = SentenceTransformer(EMBEDDING_MODEL, backend='onnx')
+            model.save(ONNX_MODEL_DIR)
+            export_dynamic_quantized_onnx_model(model, 'avx2', ONNX_MODEL_DIR)
+        
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+        model = SentenceTransformer(
+            ONNX_MODEL_DIR,
+            backend='onnx',
+            model_kwargs={
+                'file_name': ONNX_MODEL_FILE,
+                'provider': 'CPUExecutionProvider',
+                'session_options': session_options
+            }
+        )
+        return model, 'onnx-int8'
+    except Exception:
+        model = SentenceTransformer(EMBEDDING_MODEL)
+        model.eval()
+        return model, 'torch'
+
 class MCAChatbot:
     def __init__(self):
         self.config = load_config()
@@ -26,8 +161,14 @@ class MCAChatbot:
         self.processed_path = self.config['data_paths']['processed_data']
         self.load_data()
         self.setup_embeddings()
-        self.setup_intent_patterns()
+        self.setup_query_cache()
         self.setup_sample_data()
+        self.setup_capital_column()
+        self.setup_state_index()
+        self.setup_sorted_views()
+        self.setup_count_summary()
+        self.setup_intent_patterns()
+        self.setup_faq()
     
     def setup_sample_data(self):
         """Setup sample data if no real data is available"""
@@ -83,12 +224,84 @@ class MCAChatbot:
             ]
             self.df = pd.DataFrame(sample_companies)
     
+    def setup_capital_column(self):
+        """Store authorized capital as float64 and keep a numpy view of it"""
+        self.capital_values = None
+        if 'Authorized Capital' in self.df.columns:
+            self.df['Authorized Capital'] = self.df['Authorized Capital'].astype('float64')
+            self.capital_values = self.df['Authorized Capital'].to_numpy()
+    
+    def setup_state_index(self):
+        """Precompute per-state counts for state lookups"""
+        self.state_counts = pd.Series(dtype='int64')
+        if 'State' not in self.df.columns:
+            return
+        
+        # Categories in order of first appearance keep value_counts ties stable
+        states = self.df['State']
+        self.df['State'] = pd.Categorical(states, categories=states.dropna().unique().tolist())
+        self.state_codes = self.df['State'].cat.codes.to_numpy()
+        self.state_counts = pd.Series(
+            np.bincount(self.state_codes[self.state_codes >= 0], minlength=len(self.df['State'].cat.categories)),
+            index=self.df['State'].cat.categories
+        )
+    
+    def setup_sorted_views(self):
+        """Presort companies by incorporation date and by capital for top-k queries"""
+        self.df_by_date = None
+        self.df_by_capital = None
+        self.state_top3 = {}
+        self.state_avg_capital = {}
+        
+        if 'Date_of_Incorporation' in self.df.columns:
+            self.df_by_date = self.df.dropna(subset=['Date_of_Incorporation']).sort_values(
+                'Date_of_Incorporation', ascending=False, kind='stable'
+            )
+        
+        if 'Authorized Capital' in self.df.columns:
+            self.df_by_capital = self.df.dropna(subset=['Authorized Capital']).sort_values(
+                'Authorized Capital', ascending=False, kind='stable'
+            )
+            # Negated so the descending column is ascending for searchsorted
+            self.neg_sorted_capital = -self.df_by_capital['Authorized Capital'].to_numpy(dtype='float64')
+            if 'State' in self.df.columns:
+                self.sorted_capital_state_codes = self.df_by_capital['State'].cat.codes.to_numpy()
+                
+                # State answers always show the same top three and average, so build them once
+                self.state_top3 = {
+                    state: group.head(3)
+                    for state, group in self.df_by_capital.groupby('State', observed=True, sort=False)
+                }
+                self.state_avg_capital = self.df.groupby(
+                    'State', observed=True
+                )['Authorized Capital'].mean().to_dict()
+    
+    def setup_count_summary(self):
+        """Precompute the totals the count query reports"""
+        self.count_summary = {'total': len(self.df), 'n_states': None, 'avg_capital': None, 'top_states': []}
+        
+        if 'State' in self.df.columns:
+            self.count_summary['n_states'] = len(self.state_counts)
+            self.count_summary['top_states'] = self.top_states(self.state_codes, 3)
+        
+        if self.capital_values is not None:
+            # Accumulate in float64 so rupee averages don't drift
+            self.count_summary['avg_capital'] = np.nanmean(self.capital_values, dtype='float64')
+    
     def load_data(self):
         """Load data for chatbot"""
         try:
             master_file = os.path.join(self.processed_path, "master_companies.csv")
             if os.path.exists(master_file):
-                self.df = pd.read_csv(master_file)
+                available = set(pd.read_csv(master_file, nrows=0).columns)
+                usecols = [col for col in CSV_DTYPES if col in available]
+                self.df = pd.read_csv(
+                    master_file,
+                    usecols=usecols,
+                    dtype={col: CSV_DTYPES[col] for col in usecols if CSV_DTYPES[col]},
+                    parse_dates=[col for col in usecols if col == 'Date of Incorporation'],
+                    engine='pyarrow'
+                )
                 
                 # Convert date columns
                 if 'Date of Incorporation' in self.df.columns:
@@ -110,18 +323,26 @@ class MCAChatbot:
     def setup_embeddings(self):
         """Setup embeddings for semantic search"""
         try:
-            # Use a lighter model that doesn't require download
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.model, self.encoder_name = load_sentence_encoder()
             
             if not self.df.empty:
-                texts = []
-                for _, row in self.df.iterrows():
-                    text = f"{row.get('Company Name', '')} {row.get('State', '')} {row.get('Company Category', '')}"
-                    texts.append(text)
-                
-                self.embeddings = self.model.encode(texts)
-                self.index = faiss.IndexFlatIP(self.embeddings.shape[1])
-                self.index.add(self.embeddings.astype('float32'))
+                if not self.load_cached_embeddings():
+                    texts = (
+                        self.text_column('Company Name') + ' ' +
+                        self.text_column('State') + ' ' +
+                        self.text_column('Company Category')
+                    ).tolist()
+                    
+                    with torch.inference_mode():
+                        self.embeddings = self.model.encode(
+                            texts,
+                            batch_size=128,
+                            show_progress_bar=False,
+                            convert_to_numpy=True,
+                            normalize_embeddings=True
+                        ).astype('float32', copy=False)
+                    self.index = self.build_index(self.embeddings)
+                    self.save_cached_embeddings()
                 
             st.success("✅ Embeddings setup completed")
             
@@ -130,6 +351,193 @@ class MCAChatbot:
             self.model = None
             self.index = None
     
+    def build_index(self, embeddings):
+        """Build a FAISS index sized to the corpus"""
+        n, d = embeddings.shape
+        if n < FLAT_INDEX_MAX_ROWS:
+            index = faiss.IndexFlatIP(d)
+            index.add(embeddings)
+            return index
+        
+        if n < HNSW_INDEX_MAX_ROWS:
+            index = faiss.IndexHNSWFlat(d, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.add(embeddings)
+            self.tune_index(index)
+            return index
+        
+        quantizer = faiss.IndexFlatIP(d)
+        index = faiss.IndexIVFPQ(
+            quantizer, d, 4 * int(np.sqrt(n)), IVF_PQ_SUBQUANTIZERS, IVF_PQ_BITS,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(embeddings)
+        index.add(embeddings)
+        self.tune_index(index)
+        return index
+    
+    def tune_index(self, index):
+        """Apply the search-time speed/recall settings to an approximate index"""
+        if hasattr(index, 'hnsw'):
+            index.hnsw.efSearch = self.config.get('chatbot', {}).get('hnsw_ef_search', HNSW_EF_SEARCH)
+        if hasattr(index, 'nprobe'):
+            index.nprobe = IVF_NPROBE
+    
+    def embedding_cache_paths(self):
+        """Get the embedding and index cache files for the current data"""
+        key_columns = [col for col in EMBEDDING_KEY_COLUMNS if col in self.df.columns]
+        # Quantized and full-precision vectors differ, so the encoder is part of the key
+        signature = hashlib.md5(
+            pd.util.hash_pandas_object(self.df[key_columns], index=False).values
+        )
+        signature.update(self.encoder_name.encode())
+        signature = signature.hexdigest()
+        return (
+            os.path.join(self.processed_path, f"emb_{signature}.npy"),
+            os.path.join(self.processed_path, f"idx_{signature}.faiss")
+        )
+    
+    def load_cached_embeddings(self):
+        """Load embeddings and index saved for this exact data, if any"""
+        emb_file, index_file = self.embedding_cache_paths()
+        if not (os.path.exists(emb_file) and os.path.exists(index_file)):
+            return False
+        
+        try:
+            self.embeddings = np.load(emb_file)
+            self.index = faiss.read_index(index_file)
+            self.tune_index(self.index)
+            return True
+        except Exception as e:
+            st.warning(f"⚠️ Could not load cached embeddings: {e}")
+            return False
+    
+    def save_cached_embeddings(self):
+        """Save embeddings and index so the next start skips encoding"""
+        if not os.path.isdir(self.processed_path):
+            return
+        
+        emb_file, index_file = self.embedding_cache_paths()
+        try:
+            np.save(emb_file, self.embeddings)
+            faiss.write_index(self.index, index_file)
+        except Exception as e:
+            st.warning(f"⚠️ Could not save embeddings cache: {e}")
+    
+    def setup_query_cache(self):
+        """Setup the semantic cache of answered queries"""
+        self.cache_answers = []
+        self.cache_keys = []
+        self.cache_times = []
+        # The chatbot is shared by every session, so cache reads and writes are serialized
+        self.cache_lock = threading.Lock()
+        if self.model is None:
+            self.cache_index = None
+            return
+        
+        dim = self.model.get_sentence_embedding_dimension()
+        self.cache_index = faiss.IndexFlatIP(dim)
+        self.cache_embeddings = np.empty((QUERY_CACHE_CHUNK, dim), dtype='float32')
+    
+    def setup_faq(self):
+        """Embed the FAQ questions and render their answers once"""
+        self.faq_embeddings = None
+        if self.model is None or self.df.empty:
+            return
+        
+        with torch.inference_mode():
+            self.faq_embeddings = self.model.encode(
+                [question for question, _ in FAQ],
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype('float32', copy=False)
+        self.faq_answers = [getattr(self, handler)('', {}) for _, handler in FAQ]
+    
+    def match_faq(self, query, query_embedding):
+        """Get the canned answer for a query that is a close paraphrase of an FAQ"""
+        if self.faq_embeddings is None:
+            return None
+        
+        # A named state/sector or a number makes the question specific, not canned
+        query_lower = query.lower()
+        if self.keyword_regex.search(query_lower) or any(ch.isdigit() for ch in query_lower):
+            return None
+        
+        similarities = self.faq_embeddings @ query_embedding[0]
+        best = int(similarities.argmax())
+        if similarities[best] < FAQ_THRESHOLD:
+            return None
+        return self.faq_answers[best]
+    
+    def embed_query(self, query):
+        """Encode a query as a normalized float32 row vector"""
+        with torch.inference_mode():
+            return self.model.encode(
+                [query], convert_to_numpy=True, normalize_embeddings=True
+            ).astype('float32', copy=False)
+    
+    def lookup_query_cache(self, query_embedding, key):
+        """Get the cached answer for a near-identical query, if any"""
+        if self.cache_index is None:
+            return None
+        
+        with self.cache_lock:
+            if not self.cache_index.ntotal:
+                return None
+            
+            scores, indices = self.cache_index.search(query_embedding, 1)
+            idx = indices[0, 0]
+            if scores[0, 0] < QUERY_CACHE_THRESHOLD or self.cache_keys[idx] != key:
+                return None
+            
+            if time.time() - self.cache_times[idx] > QUERY_CACHE_TTL:
+                self.evict_expired_queries()
+                return None
+            
+            return self.cache_answers[idx]
+    
+    def store_query_cache(self, query_embedding, key, answer):
+        """Remember an answer for later similar queries"""
+        if self.cache_index is None:
+            return
+        
+        with self.cache_lock:
+            # Make room first, so the cache stays bounded even when lookups keep hitting fresh entries
+            self.evict_expired_queries(QUERY_CACHE_MAX_ENTRIES - 1)
+            
+            n = self.cache_index.ntotal
+            if n == len(self.cache_embeddings):
+                grown = np.empty((n + QUERY_CACHE_CHUNK, self.cache_embeddings.shape[1]), dtype='float32')
+                grown[:n] = self.cache_embeddings
+                self.cache_embeddings = grown
+            
+            self.cache_embeddings[n] = query_embedding[0]
+            self.cache_index.add(query_embedding)
+            self.cache_answers.append(answer)
+            self.cache_keys.append(key)
+            self.cache_times.append(time.time())
+    
+    def evict_expired_queries(self, max_entries=QUERY_CACHE_MAX_ENTRIES):
+        """Drop cached answers older than the TTL or beyond max_entries and rebuild the cache index (caller holds cache_lock)"""
+        # Entries are appended in time order, so expired and overflow entries form a prefix
+        n = len(self.cache_times)
+        start = max(bisect_left(self.cache_times, time.time() - QUERY_CACHE_TTL), n - max_entries)
+        if start <= 0:
+            return
+        
+        kept = n - start
+        self.cache_embeddings[:kept] = self.cache_embeddings[start:n].copy()
+        self.cache_answers = self.cache_answers[start:]
+        self.cache_keys = self.cache_keys[start:]
+        self.cache_times = self.cache_times[start:]
+        
+        self.cache_index.reset()
+        self.cache_index.add(self.cache_embeddings[:kept])
+    
+    def text_column(self, column):
+        """Get a column as strings, blank when missing"""
+        return self.df.get(column, pd.Series('', index=self.df.index)).astype('string').fillna('')
+    
     def setup_intent_patterns(self):
         """Setup intent recognition patterns"""
         self.intent_patterns = {
@@ -177,15 +585,36 @@ class MCAChatbot:
                 r'compan(y|ies).*named'
             ]
         }
+        
+        # One compiled alternation per intent, so each intent costs a single search
+        self.intent_regex = {
+            intent: re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+            for intent, patterns in self.intent_patterns.items()
+        }
+        
+        # Keyword -> (kind, value); states resolve to the label used in the data
+        # (e.g. "tamil nadu" -> "Tamil_Nadu") so bucket lookups hit
+        self.keywords = {}
+        for state in INDIAN_STATES:
+            self.keywords[state.lower()] = ('state', state)
+        for label in self.state_counts.index:
+            self.keywords[str(label).lower().replace('_', ' ')] = ('state', label)
+        for sector in SECTORS:
+            self.keywords[sector] = ('sector', sector)
+        
+        # Longest first so "west bengal" wins over any shorter overlapping name;
+        # states must be whole words, sectors also match as stems ("pharmaceuticals")
+        alternatives = [
+            re.escape(word) + (r'\b' if kind == 'state' else '')
+            for word, (kind, _) in sorted(self.keywords.items(), key=lambda kv: -len(kv[0]))
+        ]
+        self.keyword_regex = re.compile(r'\b(?:' + '|'.join(alternatives) + ')')
     
     def detect_intent(self, query):
         """Detect user intent from query"""
-        query_lower = query.lower()
-        
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    return intent
+        for intent, regex in self.intent_regex.items():
+            if regex.search(query):
+                return intent
         
         return 'general_query'
     
@@ -195,18 +624,14 @@ class MCAChatbot:
         query_lower = query.lower()
         
         if intent == 'state_query':
-            # Extract state name
-            state_match = re.search(r'compan(y|ies).*(in|from).*(\w+)', query_lower)
-            if state_match:
-                params['state'] = state_match.group(3).title()
+            state = self.find_keyword(query_lower, 'state')
+            if state:
+                params['state'] = state
             else:
-                # Try to find state names in query
-                states = ['Maharashtra', 'Gujarat', 'Delhi', 'Tamil Nadu', 'Karnataka', 
-                         'Rajasthan', 'Uttar Pradesh', 'West Bengal', 'Kerala']
-                for state in states:
-                    if state.lower() in query_lower:
-                        params['state'] = state
-                        break
+                # Fall back to whatever word follows "in"/"from"
+                state_match = re.search(r'compan(?:y|ies)\b.*?\b(?:in|from)\s+(\w+)', query_lower)
+                if state_match:
+                    params['state'] = state_match.group(1).title()
         
         elif intent == 'capital_query':
             # Extract capital amount
@@ -220,30 +645,33 @@ class MCAChatbot:
                     params['min_capital'] = float(lakh_match.group(1)) * 100000
         
         elif intent == 'sector_query':
-            if 'manufacturing' in query_lower:
-                params['sector'] = 'manufacturing'
-            elif 'technology' in query_lower or 'IT' in query_lower:
-                params['sector'] = 'technology'
-            elif 'pharmaceutical' in query_lower:
-                params['sector'] = 'pharmaceutical'
+            sector = self.find_keyword(query_lower, 'sector')
+            if sector:
+                params['sector'] = sector
         
         return params
     
+    def find_keyword(self, query_lower, kind):
+        """Get the first state or sector named in a query"""
+        for match in self.keyword_regex.finditer(query_lower):
+            keyword_kind, value = self.keywords[match.group(0)]
+            if keyword_kind == kind:
+                return value
+        return None
+    
     def semantic_search(self, query, top_k=5):
         """Perform semantic search on companies"""
         if self.index is None or self.model is None or self.df.empty:
             return self.df.head(top_k).to_dict('records')
         
         try:
-            query_embedding = self.model.encode([query])
-            scores, indices = self.index.search(query_embedding.astype('float32'), top_k)
+            scores, indices = self.index.search(self.embed_query(query), top_k)
             
-            results = []
-            for i, idx in enumerate(indices[0]):
-                if idx < len(self.df):
-                    company = self.df.iloc[idx].to_dict()
-                    company['similarity_score'] = float(scores[0][i])
-                    results.append(company)
+            # FAISS pads missing neighbours with -1
+            found = (indices[0] >= 0) & (indices[0] < len(self.df))
+            results = self.df.iloc[indices[0][found]].to_dict('records')
+            for company, score in zip(results, scores[0][found]):
+                company['similarity_score'] = float(score)
             
             return results
         except:
@@ -254,10 +682,34 @@ class MCAChatbot:
         if self.df.empty:
             return "I'm sorry, but I don't have any company data loaded right now. Please run data integration first."
         
+        query_embedding = None
+        if self.model is not None:
+            query_embedding = self.embed_query(query)
+            faq_answer = self.match_faq(query, query_embedding)
+            if faq_answer is not None:
+                return faq_answer
+        
         intent = self.detect_intent(query)
         params = self.extract_parameters(query, intent)
         
-        # Process based on intent
+        # Reuse the answer of an earlier, near-identical question with the same intent and
+        # parameters; text-answered intents also need the same normalized wording, since
+        # e.g. "Tata Motors" and "Tata Power" lookups embed close together
+        key = (intent, tuple(sorted(params.items())))
+        if intent in QUERY_TEXT_INTENTS:
+            key += (' '.join(query.lower().split()),)
+        if query_embedding is not None and self.cache_index is not None:
+            cached = self.lookup_query_cache(query_embedding, key)
+            if cached is not None:
+                return cached
+        
+        response = self.answer_query(query, intent, params)
+        if query_embedding is not None:
+            self.store_query_cache(query_embedding, key, response)
+        return response
+    
+    def answer_query(self, query, intent, params):
+        """Answer a query based on its detected intent"""
         if intent == 'new_incorporations':
             return self.handle_new_incorporations(query, params)
         elif intent == 'state_query':
@@ -275,17 +727,18 @@ class MCAChatbot:
     
     def handle_new_incorporations(self, query, params):
         """Handle new incorporations query"""
-        if 'Date_of_Incorporation' in self.df.columns:
-            recent_companies = self.df.nlargest(10, 'Date_of_Incorporation')
+        if self.df_by_date is not None and not self.df_by_date.empty:
+            recent_companies = self.df_by_date.head(10)
             count = len(recent_companies)
             
             response = f"📈 I found {count} recent company incorporations. "
             response += "Here are some of the latest companies:\n\n"
             
-            for _, company in recent_companies.head(5).iterrows():
-                response += f"• **{company.get('Company Name', 'N/A')}** - {company.get('State', 'N/A')}\n"
-                if company.get('Date_of_Incorporation'):
-                    response += f"  Incorporated: {company.get('Date_of_Incorporation').strftime('%Y-%m-%d')}\n"
+            rows = self.result_rows(recent_companies.head(5), 'Company Name', 'State', 'Date_of_Incorporation')
+            response += ''.join(
+                f"• **{name}** - {state}\n  Incorporated: {incorporated.strftime('%Y-%m-%d')}\n"
+                for name, state, incorporated in rows
+            )
             
             return response
         else:
@@ -294,24 +747,24 @@ class MCAChatbot:
     def handle_state_query(self, query, params):
         """Handle state-specific queries"""
         if 'state' in params:
-            state_companies = self.df[self.df['State'] == params['state']]
-            count = len(state_companies)
+            state = params['state']
+            count = self.state_counts.get(state, 0)
             
             if count > 0:
-                response = f"🏢 I found **{count} companies** in **{params['state']}**. "
+                response = f"🏢 I found **{count} companies** in **{state}**. "
                 
                 # Add some statistics
-                if 'Authorized Capital' in state_companies.columns:
-                    avg_capital = state_companies['Authorized Capital'].mean()
+                if 'Authorized Capital' in self.df.columns:
+                    avg_capital = self.state_avg_capital.get(state, float('nan'))
                     response += f"The average authorized capital is **₹{avg_capital:,.2f}**. "
                 
                 # Show top companies by capital
-                top_companies = state_companies.nlargest(3, 'Authorized Capital')
+                top_companies = self.state_top3.get(state, pd.DataFrame())
                 response += "\n\n**Top companies by capital:**\n"
-                
-                for _, company in top_companies.iterrows():
-                    capital = company.get('Authorized Capital', 0)
-                    response += f"• **{company.get('Company Name', 'N/A')}** - ₹{capital:,.2f}\n"
+                response += ''.join(
+                    f"• **{name}** - ₹{capital:,.2f}\n"
+                    for name, capital in self.result_rows(top_companies, 'Company Name', 'Authorized Capital')
+                )
                 
                 return response
             else:
@@ -321,51 +774,59 @@ class MCAChatbot:
     
     def handle_capital_query(self, query, params):
         """Handle capital-related queries"""
-        if 'min_capital' in params and 'Authorized Capital' in self.df.columns:
-            capital_companies = self.df[self.df['Authorized Capital'] >= params['min_capital']]
+        if 'min_capital' in params and self.df_by_capital is not None:
+            count = np.searchsorted(self.neg_sorted_capital, -params['min_capital'], side='right')
+            capital_companies = self.df_by_capital.iloc[:count]
             count = len(capital_companies)
             
             response = f"💰 I found **{count} companies** with authorized capital above **₹{params['min_capital']:,.2f}**. "
             
             if count > 0:
                 # Show distribution by state
-                state_dist = capital_companies['State'].value_counts().head(3)
+                state_dist = self.top_states(self.sorted_capital_state_codes[:count], 3)
                 response += "\n\n**Top states with high-capital companies:**\n"
-                
-                for state, state_count in state_dist.items():
-                    response += f"• **{state}**: {state_count} companies\n"
+                response += ''.join(
+                    f"• **{state}**: {state_count} companies\n" for state, state_count in state_dist
+                )
                 
                 # Show top companies
-                top_companies = capital_companies.nlargest(3, 'Authorized Capital')
+                top_companies = capital_companies.head(3)
                 response += "\n**Companies with highest capital:**\n"
-                for _, company in top_companies.iterrows():
-                    response += f"• **{company.get('Company Name', 'N/A')}** - ₹{company.get('Authorized Capital'):,.2f}\n"
+                response += ''.join(
+                    f"• **{name}** - ₹{capital:,.2f}\n"
+                    for name, capital in self.result_rows(top_companies, 'Company Name', 'Authorized Capital')
+                )
             
             return response
         else:
             return "I can help you find companies based on capital. Try asking: 'Show companies with capital above 10 lakh rupees' or 'Find companies with authorized capital above 1 crore'."
     
+    def top_states(self, codes, k):
+        """Get the k most common states among the given state codes, ties in first-seen order"""
+        categories = self.df['State'].cat.categories
+        hist = np.bincount(codes[codes >= 0], minlength=len(categories))
+        top = np.argsort(-hist, kind='stable')[:k]
+        return [(categories[code], int(hist[code])) for code in top if hist[code] > 0]
+    
     def handle_count_query(self, query, params):
         """Handle count queries"""
-        total_companies = len(self.df)
+        summary = self.count_summary
         
-        response = f"📊 There are **{total_companies:,} companies** in the database. "
+        response = f"📊 There are **{summary['total']:,} companies** in the database. "
         
         # Add some statistics
-        if 'State' in self.df.columns:
-            state_count = self.df['State'].nunique()
-            response += f"They are spread across **{state_count} states**. "
+        if summary['n_states'] is not None:
+            response += f"They are spread across **{summary['n_states']} states**. "
         
-        if 'Authorized Capital' in self.df.columns:
-            avg_capital = self.df['Authorized Capital'].mean()
-            response += f"The average authorized capital is **₹{avg_capital:,.2f}**."
+        if summary['avg_capital'] is not None:
+            response += f"The average authorized capital is **₹{summary['avg_capital']:,.2f}**."
         
         # Show state distribution
-        if 'State' in self.df.columns:
-            top_states = self.df['State'].value_counts().head(3)
+        if summary['n_states'] is not None:
             response += "\n\n**Top states by company count:**\n"
-            for state, count in top_states.items():
-                response += f"• **{state}**: {count:,} companies\n"
+            response += ''.join(
+                f"• **{state}**: {count:,} companies\n" for state, count in summary['top_states']
+            )
         
         return response
     
@@ -397,30 +858,28 @@ class MCAChatbot:
         
         return self.format_search_results(results, query)
     
+    def result_rows(self, frame, *columns):
+        """Iterate plain tuples of the given columns, 'N/A' where a column is missing"""
+        return frame.reindex(columns=list(columns), fill_value='N/A').itertuples(index=False, name=None)
+    
     def format_search_results(self, results, original_query):
         """Format search results in a nice way"""
-        if results:
-            response = "🔍 I found these companies that might match your query:\n\n"
-            
-            for company in results:
-                response += f"• **{company.get('Company Name', 'N/A')}** - {company.get('State', 'N/A')} "
-                if company.get('Authorized Capital'):
-                    response += f"(₹{company.get('Authorized Capital'):,.2f})"
-                response += "\n"
-            
-            response += "\n💡 **You can ask me about:**"
-            response += "\n• Companies in specific states"
-            response += "\n• Companies with certain capital requirements" 
-            response += "\n• Recent incorporations"
-            response += "\n• Total company counts"
-        else:
-            response = "❌ I couldn't find specific matches for your query. Try asking about:\n\n"
-            response += "• 'Companies in Maharashtra'\n"
-            response += "• 'Companies with capital above 10 lakh'\n" 
-            response += "• 'How many companies are there?'\n"
-            response += "• 'Recent company registrations'"
+        if not results:
+            return NO_RESULTS_RESPONSE
         
-        return response
+        lines = []
+        for company in results:
+            line = f"• **{company.get('Company Name', 'N/A')}** - {company.get('State', 'N/A')} "
+            if company.get('Authorized Capital'):
+                line += f"(₹{company.get('Authorized Capital'):,.2f})"
+            lines.append(line)
+        
+        return SEARCH_RESULTS_HEADER + '\n'.join(lines) + '\n' + SEARCH_HELP_SUFFIX
+
+@st.cache_resource(show_spinner=False)
+def get_chatbot():
+    """Get the chatbot shared by every session of this process"""
+    return MCAChatbot()
 
 def run_chat_interface():
     """Run the chatbot interface"""
@@ -434,9 +893,8 @@ def run_chat_interface():
     st.markdown("Ask me anything about company registrations, states, capital, or trends!")
     
     # Initialize chatbot
-    if 'chatbot' not in st.session_state:
-        with st.spinner("Loading company data and AI models..."):
-            st.session_state.chatbot = MCAChatbot()
+    with st.spinner("Loading company data and AI models..."):
+        st.session_state.chatbot = get_chatbot()
     
     if 'messages' not in st.session_state:
         st.session_state.messages = [
@@ -1,4 +1,5 @@
 import pandas as pd
+import pyarrow.parquet as pq
 import json
 import os
 import sys
@@ -7,7 +8,10 @@ from datetime import datetime, timedelta
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.utils import load_config
+from src.utils import load_config, ensure_parquet
+
+# The only master columns the summary reads
+SUMMARY_COLUMNS = ['State', 'Authorized Capital', 'Date of Incorporation']
 
 class AISummaryGenerator:
     def __init__(self):
@@ -25,12 +29,13 @@ class AISummaryGenerator:
         try:
             master_file = os.path.join(self.processed_path, "master_companies.csv")
             if os.path.exists(master_file):
-                self.df = pd.read_csv(master_file)
+                self.df = self.read_master_columns(master_file)
                 
                 # Convert date columns
                 if 'Date of Incorporation' in self.df.columns:
+                    # Processed dates are ISO; an explicit format skips per-row format inference
                     self.df['Date_of_Incorporation'] = pd.to_datetime(
-                        self.df['Date of Incorporation'], errors='coerce'
+                        self.df['Date of Incorporation'], format='ISO8601', errors='coerce', cache=True
                     )
                     
                 print(f"✅ Loaded {len(self.df)} companies for summary generation")
@@ -42,6 +47,15 @@ class AISummaryGenerator:
             print(f"Error loading data: {e}")
             self.setup_sample_data()
     
+    def read_master_columns(self, master_file):
+        """Read the summary columns from a memory-mapped Parquet copy of the master CSV"""
+        # The analysis engine owns the Parquet sidecar; later loads skip CSV parsing and the unused columns
+        parquet_file = ensure_parquet(master_file)
+        
+        available = set(pq.read_schema(parquet_file).names)
+        columns = [col for col in SUMMARY_COLUMNS if col in available]
+        return pd.read_parquet(parquet_file, columns=columns, memory_map=True)
+    
     def setup_sample_data(self):
         """Setup sample data if no real data is available"""
         sample_companies = [
@@ -82,11 +96,12 @@ class AISummaryGenerator:
             return {"error": "No data available"}
         
         # Calculate metrics
-        today = datetime.now().date()
+        now = datetime.now()
+        today = now.date()
         
         summary = {
             "report_date": today.isoformat(),
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "summary": {
                 "total_companies": len(self.df),
                 "new_incorporations_today": self.calculate_new_incorporations(today),
@@ -144,15 +159,16 @@ class AISummaryGenerator:
         summary_dir = os.path.join(self.outputs_path, "ai_summaries")
         os.makedirs(summary_dir, exist_ok=True)
         
-        filename = f"daily_summary_{datetime.now().strftime('%Y%m%d')}.json"
-        filepath = os.path.join(summary_dir, filename)
+        # File names follow the report date, so both files always share one stamp
+        stamp = summary['report_date'].replace('-', '')
+        filepath = os.path.join(summary_dir, f"daily_summary_{stamp}.json")
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
         
         # Also create a text version without emojis to avoid encoding issues
         text_summary = self.format_text_summary(summary)
-        text_filepath = os.path.join(summary_dir, f"daily_summary_{datetime.now().strftime('%Y%m%d')}.txt")
+        text_filepath = os.path.join(summary_dir, f"daily_summary_{stamp}.txt")
         
         with open(text_filepath, 'w', encoding='utf-8') as f:
             f.write(text_summary)
@@ -174,8 +190,7 @@ EXECUTIVE SUMMARY
 
 TOP STATES
 """
-        for state, count in summary['summary']['top_states'].items():
-            text += f"• {state}: {count:,} companies\n"
+        text += ''.join(f"• {state}: {count:,} companies\n" for state, count in summary['summary']['top_states'].items())
         
         text += f"""
 RECENT TRENDS
@@ -1,38 +1,88 @@
 from flask import Flask, jsonify, request
-from flask_cors import CORS
-import pandas as pd
+from flask.json.provider import JSONProvider
 import numpy as np
 from datetime import datetime
+from collections import Counter, defaultdict
+from functools import lru_cache
+import hashlib
 import urllib.parse
+import orjson
+
+class OrjsonProvider(JSONProvider):
+    """Serve jsonify/app.json through orjson, which writes bytes straight from Rust"""
+    OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.OPTIONS), mimetype='application/json')
 
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app)
+app.json = OrjsonProvider(app)
+
+# The API is public and read-only, so the CORS headers are constant
+CORS_HEADERS = {'Access-Control-Allow-Origin': '*'}
+CORS_PREFLIGHT_HEADERS = {'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS'}
+
+@app.after_request
+def add_cors_headers(response):
+    response.headers.update(CORS_HEADERS)
+    if request.method == 'OPTIONS':
+        # Flask answers OPTIONS itself; just approve the preflight
+        response.headers.update(CORS_PREFLIGHT_HEADERS)
+        requested_headers = request.headers.get('Access-Control-Request-Headers')
+        if requested_headers:
+            response.headers['Access-Control-Allow-Headers'] = requested_headers
+    return response
 
 # Generate sample MCA data
 def generate_sample_data():
-    np.random.seed(42)
+    # Every column is drawn in one vectorized call rather than per company
+    rng = np.random.default_rng(42)
+    count = 200
     industries = ['Technology', 'Manufacturing', 'Services', 'Healthcare', 'Finance', 'Retail', 'Real Estate']
     states = ['Maharashtra', 'Delhi', 'Karnataka', 'Tamil Nadu', 'Gujarat', 'Uttar Pradesh', 'West Bengal']
     
-    companies = []
-    for i in range(200):
-        inc_date = f"202{np.random.randint(2,5)}-{np.random.randint(1,13):02d}-{np.random.randint(1,28):02d}"
-        companies.append({
+    columns = zip(
+        rng.integers(2, 5, count).tolist(),
+        rng.integers(1, 13, count).tolist(),
+        rng.integers(1, 28, count).tolist(),
+        rng.integers(2, 5, count).tolist(),
+        rng.integers(100000, 999999, count).tolist(),
+        rng.choice(industries, count).tolist(),
+        rng.choice(states, count).tolist(),
+        rng.lognormal(14, 1.2, count).astype(np.int64).tolist(),
+        rng.lognormal(13, 1.0, count).astype(np.int64).tolist(),
+        rng.choice(['Active', 'Active', 'Active', 'Dormant', 'Under Process'], count,
+                   p=[0.65, 0.15, 0.10, 0.05, 0.05]).tolist(),
+        rng.integers(1, 8, count).tolist(),
+        rng.integers(1, 100, count).tolist(),
+        rng.choice(states, count).tolist()
+    )
+    companies = [
+        {
             'id': i + 1,
-            'cin': f'U72900MH202{np.random.randint(2,5)}PTC{np.random.randint(100000, 999999)}',
+            'cin': f'U72900MH202{cin_year}PTC{cin_number}',
             'name': f'Company {i} Private Limited',
-            'industry': np.random.choice(industries),
-            'state': np.random.choice(states),
-            'authorized_capital': int(np.random.lognormal(14, 1.2)),
-            'paid_up_capital': int(np.random.lognormal(13, 1.0)),
-            'incorporation_date': inc_date,
-            'status': np.random.choice(['Active', 'Active', 'Active', 'Dormant', 'Under Process'], 
-                                     p=[0.65, 0.15, 0.10, 0.05, 0.05]),
-            'director_count': np.random.randint(1, 8),
+            'industry': industry,
+            'state': state,
+            'authorized_capital': authorized_capital,
+            'paid_up_capital': paid_up_capital,
+            'incorporation_date': f"202{year}-{month:02d}-{day:02d}",
+            'status': status,
+            'director_count': director_count,
             'email': f'info@company{i}.com',
-            'address': f'{np.random.randint(1, 100)} Street, {np.random.choice(states)}'
-        })
+            'address': f'{street} Street, {address_state}'
+        }
+        for i, (year, month, day, cin_year, cin_number, industry, state, authorized_capital,
+                paid_up_capital, status, director_count, street, address_state) in enumerate(columns)
+    ]
     
     # Add some pharmaceutical companies for better search results
     pharma_companies = [
@@ -85,6 +135,124 @@ def generate_sample_data():
 
 companies_data = generate_sample_data()
 
+COMPANIES_BY_ID = {c['id']: c for c in companies_data}
+
+class DatasetTotals:
+    """Dataset totals accumulated in one pass over the companies at startup"""
+    def __init__(self, companies):
+        self.count = 0
+        self.total_capital = 0
+        self.total_directors = 0
+        self.active_count = 0
+        self.industry_counts = Counter()
+        self.state_counts = Counter()
+        self.incorporation_dates = Counter()
+        for company in companies:
+            self.count += 1
+            self.total_capital += company['authorized_capital']
+            self.total_directors += company['director_count']
+            self.active_count += company['status'] == 'Active'
+            self.industry_counts[company['industry']] += 1
+            self.state_counts[company['state']] += 1
+            self.incorporation_dates[company['incorporation_date']] += 1
+
+COMPANY_STATS = DatasetTotals(companies_data)
+
+# Search indexes, built once: trigram -> row positions for the searchable text fields.
+# A query is answered by intersecting the postings of its trigrams and verifying the
+# few surviving candidates, instead of substring-testing every company.
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def build_trigram_index(values):
+    index = defaultdict(set)
+    for pos, value in enumerate(values):
+        for gram in trigrams(value):
+            index[gram].add(pos)
+    return index
+
+def substring_matches(index, values, needle):
+    """Return positions (in dataset order) of values containing needle"""
+    if len(needle) < 3:
+        return [pos for pos, value in enumerate(values) if needle in value]
+    
+    postings = [index.get(gram) for gram in trigrams(needle)]
+    if not all(postings):
+        return []
+    candidates = set.intersection(*sorted(postings, key=len))
+    return sorted(pos for pos in candidates if needle in values[pos])
+
+def value_matches(value_positions, needle):
+    """Return positions of rows whose low-cardinality field contains needle"""
+    positions = []
+    for value, rows in value_positions.items():
+        if needle in value:
+            positions.extend(rows)
+    return positions
+
+# Names with spaces stripped: "Company 1" and "Company1" search the same way
+NAME_KEYS = [c['name'].upper().replace(' ', '') for c in companies_data]
+NAME_KEY_INDEX = build_trigram_index(NAME_KEYS)
+NAMES_LOWER = [c['name'].lower() for c in companies_data]
+NAME_INDEX = build_trigram_index(NAMES_LOWER)
+CINS_LOWER = [c['cin'].lower() for c in companies_data]
+CIN_INDEX = build_trigram_index(CINS_LOWER)
+
+def encode_column(values):
+    """Return (value -> id, int8 code per row) for a low-cardinality field"""
+    value_ids = {}
+    codes = np.array([value_ids.setdefault(value, len(value_ids)) for value in values], dtype=np.int8)
+    return value_ids, codes
+
+# Columnar copy of the filterable fields; equality filters compare int8 codes
+# and capital ranges compare an int64 array instead of walking the list of dicts
+FILTER_CODES = {
+    column: encode_column(c[column].lower() for c in companies_data)
+    for column in ('industry', 'state', 'status')
+}
+AUTHORIZED_CAPITAL = np.array([c['authorized_capital'] for c in companies_data], dtype=np.int64)
+INCORPORATION_YEARS = np.array([int(c['incorporation_date'][:4]) for c in companies_data], dtype=np.int16)
+PAID_UP_CAPITAL = np.array([c['paid_up_capital'] for c in companies_data], dtype=np.int64)
+DIRECTOR_COUNTS = np.array([c['director_count'] for c in companies_data], dtype=np.int32)
+# Display name of each industry code (its first spelling in the data)
+INDUSTRY_NAMES = [companies_data[pos]['industry'] for pos in np.unique(FILTER_CODES['industry'][1], return_index=True)[1]]
+
+# Per-value row positions for the filterable fields, so a query starts from the
+# rows of its most selective filter instead of the whole dataset; search also
+# uses them to expand industry/state substring matches
+FILTER_POSITIONS = {
+    column: {value: np.flatnonzero(codes == value_id) for value, value_id in value_ids.items()}
+    for column, (value_ids, codes) in FILTER_CODES.items()
+}
+NO_POSITIONS = np.array([], dtype=np.intp)
+
+def filter_positions(**filters):
+    """Ascending positions of companies whose fields equal the given values (case-insensitive)"""
+    given = [(column, value.lower()) for column, value in filters.items() if value]
+    if not given:
+        return np.arange(len(companies_data))
+    
+    given.sort(key=lambda item: len(FILTER_POSITIONS[item[0]].get(item[1], NO_POSITIONS)))
+    column, value = given[0]
+    positions = FILTER_POSITIONS[column].get(value, NO_POSITIONS)
+    for column, value in given[1:]:
+        value_ids, codes = FILTER_CODES[column]
+        positions = positions[codes[positions] == value_ids.get(value, -1)]
+    return positions
+
+def filter_mask(**filters):
+    """Boolean mask of companies whose fields equal the given values (case-insensitive)"""
+    mask = np.ones(len(companies_data), dtype=bool)
+    for column, value in filters.items():
+        if value:
+            value_ids, codes = FILTER_CODES[column]
+            value_id = value_ids.get(value.lower())
+            if value_id is None:
+                mask[:] = False
+            else:
+                mask &= codes == value_id
+    return mask
+
 @app.route('/')
 def home():
     return jsonify({
@@ -98,6 +266,7 @@ def home():
             "/api/companies/<id>": "GET - Get specific company details",
             "/api/stats": "GET - Get overall statistics",
             "/api/industries": "GET - Get industry analysis",
+            "/api/bundle": "GET - Get stats and industry analysis in one response",
             "/api/search": "GET - Search companies",
             "/api/companies/search": "GET - Advanced company search",
             "/api/health": "GET - API health check"
@@ -128,20 +297,20 @@ def get_company_info(company_name):
         # Search in your companies data
         matching_companies = []
         
-        for company in companies_data:
-            # Flexible matching - check if search term appears in company name
-            if (company_name_clean.upper() in company['name'].upper() or 
-                company_name_clean.upper().replace(' ', '') in company['name'].upper().replace(' ', '')):
+        # Flexible matching - the search term (spaces ignored) appears in the company name
+        search_key = company_name_clean.upper().replace(' ', '')
+        # Case-folded state comparison done once over the precomputed column
+        in_state = filter_mask(state=state)
+        for pos in substring_matches(NAME_KEY_INDEX, NAME_KEYS, search_key):
+            # Filter by state if provided
+            if not in_state[pos]:
+                continue
                 
-                # Filter by state if provided
-                if state and company['state'].lower() != state.lower():
-                    continue
-                    
-                matching_companies.append(company)
-                
-                # Stop if we reached the limit
-                if len(matching_companies) >= limit:
-                    break
+            matching_companies.append(companies_data[pos])
+            
+            # Stop if we reached the limit
+            if len(matching_companies) >= limit:
+                break
         
         if matching_companies:
             return jsonify({
@@ -178,31 +347,20 @@ def advanced_company_search():
         max_capital = request.args.get('max_capital', float('inf'), type=int)
         limit = request.args.get('limit', 20, type=int)
         
-        matching_companies = []
+        positions = filter_positions(state=state, industry=industry)
+        # Only compare the bounds that were given; the default inf bound would
+        # otherwise promote the capital column to float64
+        if min_capital > 0:
+            positions = positions[AUTHORIZED_CAPITAL[positions] >= min_capital]
+        if max_capital != float('inf'):
+            positions = positions[AUTHORIZED_CAPITAL[positions] <= max_capital]
+        if company_name:
+            name_positions = substring_matches(NAME_INDEX, NAMES_LOWER, company_name.lower())
+            positions = positions[np.isin(positions, name_positions, assume_unique=True)]
         
-        for company in companies_data:
-            matches = True
-            
-            # Name filter
-            if company_name and company_name.upper() not in company['name'].upper():
-                matches = False
-                
-            # State filter
-            if state and company['state'].lower() != state.lower():
-                matches = False
-                
-            # Industry filter
-            if industry and company['industry'].lower() != industry.lower():
-                matches = False
-                
-            # Capital range filter
-            if company['authorized_capital'] < min_capital or company['authorized_capital'] > max_capital:
-                matches = False
-                
-            if matches:
-                matching_companies.append(company)
-                if len(matching_companies) >= limit:
-                    break
+        # At least one match is returned even for a non-positive limit
+        positions = positions[:max(limit, 1)]
+        matching_companies = [companies_data[pos] for pos in positions]
         
         return jsonify({
             'filters': {
@@ -228,23 +386,23 @@ def get_companies():
     state = request.args.get('state')
     status = request.args.get('status')
     
-    filtered_data = companies_data
-    
-    # Apply filters
-    if industry:
-        filtered_data = [c for c in filtered_data if c['industry'].lower() == industry.lower()]
-    if state:
-        filtered_data = [c for c in filtered_data if c['state'].lower() == state.lower()]
-    if status:
-        filtered_data = [c for c in filtered_data if c['status'].lower() == status.lower()]
+    # Unfiltered listings page straight through companies_data; only the
+    # requested slice is touched instead of building a mask and index array
+    if industry or state or status:
+        positions = filter_positions(industry=industry, state=state, status=status)
+    else:
+        positions = None
     
     # Pagination
-    total_companies = len(filtered_data)
+    total_companies = len(companies_data) if positions is None else len(positions)
     total_pages = (total_companies + per_page - 1) // per_page
     start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
     
-    paginated_data = filtered_data[start_idx:end_idx]
+    if positions is None:
+        paginated_data = companies_data[start_idx:end_idx]
+    else:
+        paginated_data = [companies_data[pos] for pos in positions[start_idx:end_idx]]
     
     return jsonify({
         'page': page,
@@ -256,60 +414,77 @@ def get_companies():
 
 @app.route('/api/companies/<int:company_id>', methods=['GET'])
 def get_company(company_id):
-    company = next((c for c in companies_data if c['id'] == company_id), None)
+    company = COMPANIES_BY_ID.get(company_id)
     if company:
         return jsonify(company)
     else:
         return jsonify({'error': 'Company not found'}), 404
 
-@app.route('/api/stats', methods=['GET'])
-def get_stats():
-    df = pd.DataFrame(companies_data)
+def compute_stats():
+    """Compute overall statistics for the companies dataset"""
+    totals = COMPANY_STATS
     
     stats = {
-        'total_companies': len(companies_data),
-        'active_companies': len([c for c in companies_data if c['status'] == 'Active']),
-        'industries_count': df['industry'].nunique(),
-        'states_count': df['state'].nunique(),
-        'avg_capital': int(df['authorized_capital'].mean()),
-        'total_capital': int(df['authorized_capital'].sum()),
-        'avg_directors': float(df['director_count'].mean()),
-        'latest_incorporation': df['incorporation_date'].max()
+        'total_companies': totals.count,
+        'active_companies': totals.active_count,
+        'industries_count': len(totals.industry_counts),
+        'states_count': len(totals.state_counts),
+        'avg_capital': int(totals.total_capital / totals.count),
+        'total_capital': totals.total_capital,
+        'avg_directors': totals.total_directors / totals.count,
+        'latest_incorporation': max(totals.incorporation_dates)
     }
     
     # Industry distribution
-    industry_dist = df['industry'].value_counts().to_dict()
-    stats['industry_distribution'] = industry_dist
+    stats['industry_distribution'] = dict(totals.industry_counts.most_common())
     
     # State distribution
-    state_dist = df['state'].value_counts().to_dict()
-    stats['state_distribution'] = state_dist
+    stats['state_distribution'] = dict(totals.state_counts.most_common())
     
-    return jsonify(stats)
+    return stats
 
-@app.route('/api/industries', methods=['GET'])
-def get_industries():
-    df = pd.DataFrame(companies_data)
-    industry_stats = df.groupby('industry').agg({
-        'id': 'count',
-        'authorized_capital': ['sum', 'mean', 'median'],
-        'paid_up_capital': 'sum',
-        'director_count': 'mean'
-    }).round(2)
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    return cached_json_response('stats')
+
+def compute_industries():
+    """Compute per-industry statistics, largest industries first"""
+    # One bincount pass per aggregate over the shared industry filter codes
+    codes = FILTER_CODES['industry'][1]
+    counts = np.bincount(codes, minlength=len(INDUSTRY_NAMES))
+    capital_sums = np.bincount(codes, weights=AUTHORIZED_CAPITAL, minlength=len(INDUSTRY_NAMES))
+    paid_sums = np.bincount(codes, weights=PAID_UP_CAPITAL, minlength=len(INDUSTRY_NAMES))
+    director_sums = np.bincount(codes, weights=DIRECTOR_COUNTS, minlength=len(INDUSTRY_NAMES))
+    
+    # Medians from one stable sort by (industry, capital)
+    order = np.lexsort((AUTHORIZED_CAPITAL, codes))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sorted_capital = AUTHORIZED_CAPITAL[order]
+    medians = np.array([np.median(sorted_capital[start:start + count]) for start, count in zip(starts, counts)])
     
     result = []
-    for industry, data in industry_stats.iterrows():
+    # Alphabetical before the stable count sort, so ties keep their name order
+    for code in sorted(range(len(INDUSTRY_NAMES)), key=INDUSTRY_NAMES.__getitem__):
         result.append({
-            'industry': industry,
-            'company_count': int(data[('id', 'count')]),
-            'total_authorized_capital': int(data[('authorized_capital', 'sum')]),
-            'avg_authorized_capital': int(data[('authorized_capital', 'mean')]),
-            'median_authorized_capital': int(data[('authorized_capital', 'median')]),
-            'total_paid_capital': int(data[('paid_up_capital', 'sum')]),
-            'avg_directors': float(data[('director_count', 'mean')])
+            'industry': INDUSTRY_NAMES[code],
+            'company_count': int(counts[code]),
+            'total_authorized_capital': int(capital_sums[code]),
+            'avg_authorized_capital': int(np.round(capital_sums[code] / counts[code], 2)),
+            'median_authorized_capital': int(np.round(medians[code], 2)),
+            'total_paid_capital': int(paid_sums[code]),
+            'avg_directors': float(np.round(director_sums[code] / counts[code], 2))
         })
     
-    return jsonify(sorted(result, key=lambda x: x['company_count'], reverse=True))
+    return sorted(result, key=lambda x: x['company_count'], reverse=True)
+
+@app.route('/api/industries', methods=['GET'])
+def get_industries():
+    return cached_json_response('industries')
+
+@app.route('/api/bundle', methods=['GET'])
+def get_bundle():
+    """Return stats and industries together so clients need one round trip"""
+    return cached_json_response('bundle')
 
 @app.route('/api/search', methods=['GET'])
 def search_companies():
@@ -317,13 +492,12 @@ def search_companies():
     if not query or len(query) < 2:
         return jsonify({'error': 'Query parameter required (min 2 characters)'}), 400
     
-    results = [
-        c for c in companies_data 
-        if query.lower() in c['name'].lower() or 
-           query.lower() in c['industry'].lower() or
-           query.lower() in c['state'].lower() or
-           query.lower() in c['cin'].lower()
-    ]
+    needle = query.lower()
+    positions = set(substring_matches(NAME_INDEX, NAMES_LOWER, needle))
+    positions.update(value_matches(FILTER_POSITIONS['industry'], needle))
+    positions.update(value_matches(FILTER_POSITIONS['state'], needle))
+    positions.update(substring_matches(CIN_INDEX, CINS_LOWER, needle))
+    results = [companies_data[pos] for pos in sorted(positions)]
     
     return jsonify({
         'query': query,
@@ -331,25 +505,53 @@ def search_companies():
         'count': len(results)
     })
 
+def compute_trends():
+    """Compute company counts and average capital per incorporation year"""
+    years, year_idx, counts = np.unique(INCORPORATION_YEARS, return_inverse=True, return_counts=True)
+    avg_capital = np.bincount(year_idx, weights=AUTHORIZED_CAPITAL) / counts
+    
+    return [
+        {'year': int(year), 'company_count': int(count), 'avg_capital': int(avg)}
+        for year, count, avg in zip(years, counts, avg_capital)
+    ]
+
 @app.route('/api/trends', methods=['GET'])
 def get_trends():
-    df = pd.DataFrame(companies_data)
-    df['incorporation_year'] = pd.to_datetime(df['incorporation_date']).dt.year
-    
-    yearly_trends = df.groupby('incorporation_year').agg({
-        'id': 'count',
-        'authorized_capital': 'mean'
-    }).reset_index()
-    
-    trends_data = []
-    for _, row in yearly_trends.iterrows():
-        trends_data.append({
-            'year': int(row['incorporation_year']),
-            'company_count': int(row['id']),
-            'avg_capital': int(row['authorized_capital'])
-        })
-    
-    return jsonify(trends_data)
+    return cached_json_response('trends')
+
+# The dataset is generated once and never mutated, so the aggregate endpoints are
+# computed and serialized a single time. Anything that changes companies_data must
+# bump DATA_VERSION so the next request recomputes.
+DATA_VERSION = 0
+
+AGGREGATES = {
+    'stats': compute_stats,
+    'industries': compute_industries,
+    'trends': compute_trends,
+    'bundle': lambda: {'stats': compute_stats(), 'industries': compute_industries()}
+}
+
+# Clients may reuse a cached aggregate for this long before revalidating with its ETag
+AGGREGATE_MAX_AGE = 60
+
+@lru_cache(maxsize=len(AGGREGATES))
+def serialize_aggregate(name, version):
+    """Return the JSON body of an aggregate and its ETag"""
+    body = app.json.dumps(AGGREGATES[name]()).encode()
+    return body, hashlib.md5(body).hexdigest()
+
+def cached_json_response(name):
+    body, etag = serialize_aggregate(name, DATA_VERSION)
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = AGGREGATE_MAX_AGE
+    # Answers a matching If-None-Match with an empty 304
+    return response.make_conditional(request)
+
+# Serialize everything up front so the first request is already a cache hit
+for aggregate_name in AGGREGATES:
+    serialize_aggregate(aggregate_name, DATA_VERSION)
 
 if __name__ == '__main__':
     print("🚀 Starting MCA Insights API Server...")
@@ -1,11 +1,115 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 
+# MCA_BACKEND=modin swaps in Modin's drop-in pandas API for multi-core groupbys on large data
+if os.environ.get('MCA_BACKEND') == 'modin':
+    import modin.pandas as pd
+else:
+    import pandas as pd
+    # Skip defensive copies when slicing (always on from pandas 3)
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.options.mode.copy_on_write = True
+
+# Traces with at least this many points are drawn with WebGL instead of SVG
+MIN_GL_ROWS = 1000
+
+# Generated sample data is persisted here so cold starts read it instead of rebuilding it;
+# bump the version whenever the generator changes
+SAMPLE_DATA_VERSION = 5
+SAMPLE_DATA_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'dataset', 'processed',
+    f'dashboard_sample_v{SAMPLE_DATA_VERSION}.parquet'
+)
+SAMPLE_ROWS = 1000
+
+# Per-industry cap on the points sent to the browser for financial charts
+CHART_POINTS_PER_GROUP = 5000
+
+def render_mode(row_count):
+    """Pick the Plotly render mode for a trace with row_count points"""
+    return 'webgl' if row_count >= MIN_GL_ROWS else 'svg'
+
+# Aggregations are cached per dataset version: the leading underscore tells Streamlit
+# not to hash the frame, so a hit costs a dict lookup instead of hashing every row
+@st.cache_data
+def value_counts(_df, version, column):
+    return _df[column].value_counts()
+
+@st.cache_data
+def yearly_counts(_df, version):
+    return _df.groupby('incorporation_year').size()
+
+@st.cache_data
+def industry_directors(_df, version):
+    return _df.groupby('industry', observed=True)['director_count'].mean().sort_values(ascending=False)
+
+def yearly_counts_by(df, column, top_n=None):
+    """Long-form (year, category, count) rows, bucket-counted over the category codes"""
+    categories = df[column].cat.categories
+    codes = df[column].cat.codes.to_numpy()
+    years, year_codes = np.unique(df['incorporation_year'].to_numpy(), return_inverse=True)
+    
+    # One bincount over the flattened (year x category) grid replaces the hash groupby
+    present = codes >= 0
+    grid = np.bincount(
+        year_codes[present] * len(categories) + codes[present],
+        minlength=len(years) * len(categories)
+    ).reshape(len(years), len(categories))
+    if top_n is not None:
+        top_values = df[column].value_counts().head(top_n).index
+        grid[:, ~categories.isin(top_values)] = 0
+    
+    year_idx, category_idx = np.nonzero(grid)
+    return pd.DataFrame({
+        'incorporation_year': years[year_idx],
+        column: pd.Categorical.from_codes(category_idx, categories),
+        'count': grid[year_idx, category_idx]
+    })
+
+@st.cache_data
+def histogram_counts(_df, version, column, bins):
+    """Bin a column server-side so the chart ships bin counts instead of every row"""
+    counts, edges = np.histogram(_df[column].to_numpy(), bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, counts, np.diff(edges)
+
+@st.cache_data
+def integer_counts(_df, version, column):
+    """Count each distinct value of a small non-negative integer column"""
+    counts = np.bincount(_df[column].to_numpy())
+    values = np.flatnonzero(counts)
+    return values, counts[values]
+
+@st.cache_data
+def sample_per_group(_df, version, group, per_group=CHART_POINTS_PER_GROUP):
+    """Keep at most per_group random rows of each group, in original row order"""
+    if _df[group].value_counts().max() <= per_group:
+        return _df
+    shuffled = _df.sample(frac=1, random_state=0)
+    kept = shuffled[shuffled.groupby(group, observed=True).cumcount() < per_group]
+    return kept.sort_index()
+
+@st.cache_data
+def trend_tables(_df, version):
+    """Every trends-view table in one cached pass: by industry, top-5 states, capital"""
+    yearly_industry = yearly_counts_by(_df, 'industry')
+    state_yearly = yearly_counts_by(_df, 'state', top_n=5)
+    capital_by_year = _df.groupby('incorporation_year')['authorized_capital'].mean().reset_index()
+    return yearly_industry, state_yearly, capital_by_year
+
+def filter_companies(df, industry, state):
+    """Rows matching the industry/state selectboxes; 'All' skips that comparison"""
+    if industry == 'All' and state == 'All':
+        return df
+    if industry == 'All':
+        return df[(df['state'] == state).to_numpy()]
+    if state == 'All':
+        return df[(df['industry'] == industry).to_numpy()]
+    return df[(df['industry'] == industry).to_numpy() & (df['state'] == state).to_numpy()]
+
 def main():
     st.set_page_config(
         page_title="MCA Insights Dashboard",
@@ -45,28 +149,39 @@ def main():
     # Sample data generation (replace with your actual data)
     @st.cache_data
     def load_sample_data():
-        # Generate sample company data
-        np.random.seed(42)
-        dates = pd.date_range('2020-01-01', '2024-01-01', freq='M')
+        if os.path.exists(SAMPLE_DATA_FILE):
+            # Parquet round-trips strings as plain StringDtype; put them back on Arrow buffers
+            return pd.read_parquet(SAMPLE_DATA_FILE).convert_dtypes(dtype_backend='pyarrow')
+        
+        # Generate sample company data, one vectorized draw per column
+        rng = np.random.default_rng(42)
+        dates = pd.date_range('2020-01-01', '2024-01-01', freq='ME')
         industries = ['Technology', 'Manufacturing', 'Services', 'Healthcare', 'Finance', 'Retail']
         states = ['Maharashtra', 'Delhi', 'Karnataka', 'Tamil Nadu', 'Gujarat', 'Uttar Pradesh']
         
-        data = []
-        for i in range(1000):
-            data.append({
-                'company_id': f'COMP{i:04d}',
-                'company_name': f'Company {i}',
-                'incorporation_date': np.random.choice(dates),
-                'industry': np.random.choice(industries),
-                'state': np.random.choice(states),
-                'authorized_capital': np.random.lognormal(12, 1.5),
-                'paid_up_capital': np.random.lognormal(11, 1.2),
-                'director_count': np.random.randint(1, 8),
-                'status': np.random.choice(['Active', 'Active', 'Active', 'Dormant'], p=[0.7, 0.2, 0.05, 0.05])
-            })
+        df = pd.DataFrame({
+            'company_id': [f'COMP{i:04d}' for i in range(SAMPLE_ROWS)],
+            'company_name': [f'Company {i}' for i in range(SAMPLE_ROWS)],
+            'incorporation_date': rng.choice(dates, SAMPLE_ROWS),
+            'industry': rng.choice(industries, SAMPLE_ROWS),
+            'state': rng.choice(states, SAMPLE_ROWS),
+            'authorized_capital': rng.lognormal(12, 1.5, SAMPLE_ROWS),
+            'paid_up_capital': rng.lognormal(11, 1.2, SAMPLE_ROWS),
+            'director_count': rng.integers(1, 8, SAMPLE_ROWS),
+            'status': rng.choice(['Active', 'Dormant'], SAMPLE_ROWS, p=[0.95, 0.05])
+        })
+        df['incorporation_year'] = df['incorporation_date'].dt.year.astype('int16')
+        # Low-cardinality labels as categoricals: counts, groupbys and filters work on int8 codes
+        for column in ('industry', 'state', 'status'):
+            df[column] = df[column].astype('category')
+        # Everything else on Arrow buffers: no boxed Python strings, zero-copy numeric views
+        df = df.convert_dtypes(dtype_backend='pyarrow')
         
-        df = pd.DataFrame(data)
-        df['incorporation_year'] = df['incorporation_date'].dt.year
+        try:
+            os.makedirs(os.path.dirname(SAMPLE_DATA_FILE), exist_ok=True)
+            df.to_parquet(SAMPLE_DATA_FILE, compression='snappy', index=False)
+        except OSError:
+            pass  # Read-only checkout: keep serving the in-memory copy
         return df
     
     df = load_sample_data()
@@ -94,7 +209,7 @@ def show_overview(df):
         st.metric("Total Companies", f"{total_companies:,}")
     
     with col2:
-        active_companies = len(df[df['status'] == 'Active'])
+        active_companies = int((df['status'] == 'Active').sum())
         st.metric("Active Companies", f"{active_companies:,}")
     
     with col3:
@@ -103,7 +218,7 @@ def show_overview(df):
     
     with col4:
         current_year = datetime.now().year
-        recent_companies = len(df[df['incorporation_year'] == current_year])
+        recent_companies = int((df['incorporation_year'].to_numpy() == current_year).sum())
         st.metric(f"New in {current_year}", f"{recent_companies}")
     
     # Charts row 1
@@ -111,7 +226,7 @@ def show_overview(df):
     
     with col1:
         st.subheader("Companies by Industry")
-        industry_counts = df['industry'].value_counts()
+        industry_counts = value_counts(df, SAMPLE_DATA_VERSION, 'industry')
         fig = px.pie(
             values=industry_counts.values,
             names=industry_counts.index,
@@ -121,7 +236,7 @@ def show_overview(df):
     
     with col2:
         st.subheader("Companies by State")
-        state_counts = df['state'].value_counts().head(10)
+        state_counts = value_counts(df, SAMPLE_DATA_VERSION, 'state').head(10)
         fig = px.bar(
             x=state_counts.values,
             y=state_counts.index,
@@ -135,22 +250,25 @@ def show_overview(df):
     
     with col1:
         st.subheader("Registration Trends")
-        yearly_counts = df.groupby('incorporation_year').size()
+        yearly = yearly_counts(df, SAMPLE_DATA_VERSION)
         fig = px.line(
-            x=yearly_counts.index,
-            y=yearly_counts.values,
-            title="Company Registrations by Year"
+            x=yearly.index,
+            y=yearly.values,
+            title="Company Registrations by Year",
+            render_mode=render_mode(len(yearly))
         )
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("Capital Distribution")
-        fig = px.histogram(
-            df,
-            x='authorized_capital',
-            nbins=20,
+        centers, counts, widths = histogram_counts(df, SAMPLE_DATA_VERSION, 'authorized_capital', 20)
+        fig = px.bar(
+            x=centers,
+            y=counts,
+            labels={'x': 'authorized_capital', 'y': 'count'},
             title="Authorized Capital Distribution"
         )
+        fig.update_traces(width=widths)
         st.plotly_chart(fig, use_container_width=True)
 
 def show_company_analysis(df):
@@ -161,21 +279,17 @@ def show_company_analysis(df):
     with col1:
         selected_industry = st.selectbox(
             "Select Industry",
-            ['All'] + list(df['industry'].unique())
+            ['All'] + df['industry'].cat.categories.tolist()
         )
     
     with col2:
         selected_state = st.selectbox(
             "Select State",
-            ['All'] + list(df['state'].unique())
+            ['All'] + df['state'].cat.categories.tolist()
         )
     
-    # Filter data
-    filtered_df = df.copy()
-    if selected_industry != 'All':
-        filtered_df = filtered_df[filtered_df['industry'] == selected_industry]
-    if selected_state != 'All':
-        filtered_df = filtered_df[filtered_df['state'] == selected_state]
+    # Filter data; unfiltered views reuse df without copying
+    filtered_df = filter_companies(df, selected_industry, selected_state)
     
     # Display filtered results
     st.subheader("Company Details")
@@ -206,20 +320,21 @@ def show_director_insights(df):
     
     with col1:
         st.subheader("Directors per Company")
-        fig = px.histogram(
-            df,
-            x='director_count',
-            nbins=10,
+        values, counts = integer_counts(df, SAMPLE_DATA_VERSION, 'director_count')
+        fig = px.bar(
+            x=values,
+            y=counts,
+            labels={'x': 'director_count', 'y': 'count'},
             title="Distribution of Director Count"
         )
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("Director Patterns by Industry")
-        industry_directors = df.groupby('industry')['director_count'].mean().sort_values(ascending=False)
+        directors = industry_directors(df, SAMPLE_DATA_VERSION)
         fig = px.bar(
-            x=industry_directors.values,
-            y=industry_directors.index,
+            x=directors.values,
+            y=directors.index,
             orientation='h',
             title="Average Directors per Company by Industry"
         )
@@ -228,12 +343,19 @@ def show_director_insights(df):
 def show_financial_patterns(df):
     st.header("💰 Financial Patterns")
     
+    show_all = st.checkbox(
+        "Show all points",
+        value=False,
+        help=f"By default at most {CHART_POINTS_PER_GROUP:,} companies per industry are plotted"
+    )
+    plot_df = df if show_all else sample_per_group(df, SAMPLE_DATA_VERSION, 'industry')
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Capital vs Industry")
         fig = px.box(
-            df,
+            plot_df,
             x='industry',
             y='authorized_capital',
             title="Authorized Capital Distribution by Industry"
@@ -243,26 +365,28 @@ def show_financial_patterns(df):
     with col2:
         st.subheader("Paid-up vs Authorized Capital")
         fig = px.scatter(
-            df,
+            plot_df,
             x='authorized_capital',
             y='paid_up_capital',
             color='industry',
-            title="Capital Utilization Analysis"
+            title="Capital Utilization Analysis",
+            render_mode=render_mode(len(plot_df))
         )
         st.plotly_chart(fig, use_container_width=True)
 
 def show_trends_analysis(df):
     st.header("📅 Trends Analysis")
     
-    # Yearly trends by industry
-    yearly_industry = df.groupby(['incorporation_year', 'industry']).size().reset_index(name='count')
+    # Yearly trend tables, computed once per dataset version
+    yearly_industry, state_yearly, capital_by_year = trend_tables(df, SAMPLE_DATA_VERSION)
     
     fig = px.line(
         yearly_industry,
         x='incorporation_year',
         y='count',
         color='industry',
-        title="Company Registration Trends by Industry"
+        title="Company Registration Trends by Industry",
+        render_mode=render_mode(len(yearly_industry))
     )
     st.plotly_chart(fig, use_container_width=True)
     
@@ -270,27 +394,24 @@ def show_trends_analysis(df):
     col1, col2 = st.columns(2)
     
     with col1:
-        top_states = df['state'].value_counts().head(5).index
-        state_trends = df[df['state'].isin(top_states)]
-        state_yearly = state_trends.groupby(['incorporation_year', 'state']).size().reset_index(name='count')
-        
         fig = px.line(
             state_yearly,
             x='incorporation_year',
             y='count',
             color='state',
-            title="Top 5 States - Registration Trends"
+            title="Top 5 States - Registration Trends",
+            render_mode=render_mode(len(state_yearly))
         )
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Capital trends
-        capital_trends = df.groupby('incorporation_year')['authorized_capital'].mean().reset_index()
         fig = px.line(
-            capital_trends,
+            capital_by_year,
             x='incorporation_year',
             y='authorized_capital',
-            title="Average Authorized Capital Trend"
+            title="Average Authorized Capital Trend",
+            render_mode=render_mode(len(capital_by_year))
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -1,13 +1,32 @@
 import streamlit as st
+import pandas as pd
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import yaml
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Raw inputs we accept; everything is normalised to Parquet in the processed directory
+INPUT_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.parquet')
+
 st.set_page_config(page_title="Data Integration Runner", layout="wide")
 
 st.title("Data Integration Runner")
 st.subheader("Run data integration to process your raw Excel files")
 
+@st.cache_data
+def read_yaml_config(config_path, mtime):
+    """Parse a config file once per modification time instead of on every rerun"""
+    with open(config_path, 'rb') as file:
+        return yaml.load(file, Loader=SafeLoader)
+
 # Configuration loading with better error handling
 def load_config():
     # Try multiple possible config locations
@@ -20,8 +39,7 @@ def load_config():
     for config_path in possible_paths:
         if config_path.exists():
             try:
-                with open(config_path, 'r') as file:
-                    config = yaml.safe_load(file)
+                config = read_yaml_config(str(config_path), config_path.stat().st_mtime)
                 st.success(f"✅ Configuration loaded from: {config_path}")
                 return config
             except Exception as e:
@@ -47,7 +65,7 @@ def create_default_config():
             'timeout': 300
         },
         'file_handling': {
-            'allowed_extensions': ['.xlsx', '.xls', '.csv'],
+            'allowed_extensions': list(INPUT_EXTENSIONS),
             'max_file_size_mb': 50,
             'auto_create_dirs': True
         }
@@ -59,11 +77,66 @@ def create_default_config():
     
     config_file = config_dir / "config.yaml"
     with open(config_file, 'w') as f:
-        yaml.dump(default_config, f, default_flow_style=False)
+        yaml.dump(default_config, f, Dumper=SafeDumper, default_flow_style=False)
     
     st.success(f"✅ Default config created at: {config_file}")
     return default_config
 
+def convert_to_parquet(source_path, processed_dir):
+    """Write a snappy Parquet copy of an input file, skipping it when already up to date"""
+    # The full file name is kept (delhi.xlsx -> delhi.xlsx.parquet) so inputs that only
+    # differ by extension never write the same target
+    file_name = os.path.basename(source_path)
+    extension = os.path.splitext(file_name)[1]
+    target_path = os.path.join(processed_dir, f"{file_name}.parquet")
+    if os.path.exists(target_path) and os.path.getmtime(target_path) >= os.path.getmtime(source_path):
+        return target_path
+    
+    extension = extension.lower()
+    if extension == '.csv':
+        # Arrow's CSV reader is multi-threaded and skips the pandas round trip
+        table = pa_csv.read_csv(source_path)
+        pq.write_table(table, target_path, compression='snappy')
+    elif extension == '.parquet':
+        pq.write_table(pq.read_table(source_path), target_path, compression='snappy')
+    else:
+        pd.read_excel(source_path).to_parquet(target_path, compression='snappy', index=False)
+    return target_path
+
+def input_file_names(input_dir):
+    """Names of supported input files, from a single directory scan"""
+    with os.scandir(input_dir) as entries:
+        return [entry.name for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(INPUT_EXTENSIONS)]
+
+def count_input_files(input_dir):
+    return len(input_file_names(input_dir))
+
+def save_and_convert(input_dir, processed_dir, name, buffer):
+    """Save an uploaded file to the input directory and convert it to Parquet"""
+    source_path = os.path.join(input_dir, name)
+    with open(source_path, "wb") as f:
+        f.write(buffer)
+    return convert_to_parquet(source_path, processed_dir)
+
+def run_parallel(config, task, items, names, progress_bar, status_text):
+    """Run task(*item) across a thread pool (file I/O and Arrow parsing release the GIL); returns the names that failed"""
+    max_workers = config.get('processing', {}).get('max_workers', 4)
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(task, *item): name for item, name in zip(items, names)}
+        for i, future in enumerate(as_completed(futures)):
+            name = futures[future]
+            # One unreadable file is reported and skipped; the rest still convert
+            try:
+                target_path = future.result()
+                status_text.text(f"Processed: {os.path.basename(target_path)} ({i+1}/{len(futures)})")
+            except Exception as e:
+                failed.append(name)
+                st.error(f"❌ Could not convert {name}: {str(e)}")
+            progress_bar.progress((i + 1) / len(futures))
+    return failed
+
 # Load configuration
 config = load_config()
 
@@ -82,25 +155,24 @@ if config:
     with col1:
         if st.button("🚀 Run Data Integration", type="primary", use_container_width=True):
             input_dir = config['data_sources']['excel']['input_directory']
+            processed_dir = config['data_sources']['excel']['processed_directory']
             if os.path.exists(input_dir):
-                files = [f for f in os.listdir(input_dir) if f.endswith(('.xlsx', '.xls', '.csv'))]
+                files = input_file_names(input_dir)
                 if files:
                     st.success(f"Found {len(files)} files to process")
-                    # Add your file processing logic here
+                    os.makedirs(processed_dir, exist_ok=True)
                     
-                    # Simulate processing
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    for i, file in enumerate(files):
-                        progress = (i + 1) / len(files)
-                        progress_bar.progress(progress)
-                        status_text.text(f"Processing: {file} ({i+1}/{len(files)})")
-                        # Simulate processing time
-                        import time
-                        time.sleep(0.5)
+                    # Downstream steps read the Parquet copies (with column projection)
+                    items = [(os.path.join(input_dir, file), processed_dir) for file in files]
+                    failed = run_parallel(config, convert_to_parquet, items, files, progress_bar, status_text)
                     
-                    st.success("✅ Data integration completed successfully!")
+                    if failed:
+                        st.warning(f"⚠️ Data integration finished: {len(files) - len(failed)} of {len(files)} files converted")
+                    else:
+                        st.success("✅ Data integration completed successfully!")
                 else:
                     st.warning("No Excel/CSV files found in input directory")
             else:
@@ -115,9 +187,8 @@ if config:
             col_a, col_b, col_c = st.columns(3)
             with col_a:
                 if os.path.exists(input_dir):
-                    files = [f for f in os.listdir(input_dir) if f.endswith(('.xlsx', '.xls', '.csv'))]
                     st.success(f"✅ Input: {input_dir}")
-                    st.write(f"Files: {len(files)}")
+                    st.write(f"Files: {count_input_files(input_dir)}")
                 else:
                     st.error(f"❌ Input: {input_dir}")
             
@@ -151,8 +222,8 @@ if config:
     st.subheader("📤 Upload Excel Files")
     
     uploaded_files = st.file_uploader(
-        "Choose Excel/CSV files", 
-        type=['xlsx', 'xls', 'csv'],
+        "Choose Excel/CSV/Parquet files", 
+        type=[extension.lstrip('.') for extension in INPUT_EXTENSIONS],
         accept_multiple_files=True,
         help="Upload your raw Excel or CSV files for processing"
     )
@@ -168,14 +239,21 @@ if config:
         # Process uploaded files
         if st.button("Process Uploaded Files"):
             input_dir = config['data_sources']['excel']['input_directory']
+            processed_dir = config['data_sources']['excel']['processed_directory']
             os.makedirs(input_dir, exist_ok=True)
+            os.makedirs(processed_dir, exist_ok=True)
             
-            for uploaded_file in uploaded_files:
-                # Save uploaded file to input directory
-                with open(os.path.join(input_dir, uploaded_file.name), "wb") as f:
-                    f.write(uploaded_file.getbuffer())
+            # Save uploaded files to the input directory and convert them concurrently
+            items = [(input_dir, processed_dir, uploaded_file.name, uploaded_file.getvalue())
+                     for uploaded_file in uploaded_files]
+            names = [uploaded_file.name for uploaded_file in uploaded_files]
+            failed = run_parallel(config, save_and_convert, items, names, st.progress(0), st.empty())
             
-            st.success(f"✅ {len(uploaded_files)} files saved to {input_dir}")
+            converted = len(uploaded_files) - len(failed)
+            if converted:
+                st.success(f"✅ {converted} files saved to {input_dir} and converted to Parquet in {processed_dir}")
+            if failed:
+                st.warning(f"⚠️ {len(failed)} files could not be converted: {', '.join(failed)}")
 
 else:
     st.error("❌ Failed to load configuration")
\ No newline at end of file
@@ -0,0 +1,9 @@
+"""WSGI entry point for serving the MCA Insights API with gunicorn.
+
+Run from the dashboard folder:
+    gunicorn -w $(nproc) -k gthread --threads 4 --preload -b 0.0.0.0:5000 wsgi:app
+"""
+from api import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000)
@@ -1,8 +1,53 @@
+import importlib
+import multiprocessing
 import os
+import shutil
 import subprocess
 import sys
-import threading
-import time
+from functools import lru_cache
+
+# Folders that hold the launchable service scripts
+SERVICE_DIRS = ('.', 'dashboard', 'ai')
+
+@lru_cache(maxsize=1)
+def file_index():
+    """Relative paths of every file in SERVICE_DIRS, from one scan per folder"""
+    index = set()
+    for folder in SERVICE_DIRS:
+        if os.path.isdir(folder):
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        index.add(entry.name if folder == '.' else f"{folder}/{entry.name}")
+    return index
+
+def first_existing(candidates):
+    index = file_index()
+    return next((candidate for candidate in candidates if candidate in index), None)
+
+# Imported once in the launcher so forked Streamlit services start with them warm
+PRELOAD_MODULES = ('numpy', 'pandas', 'plotly.express', 'streamlit.web.bootstrap')
+
+def serve_streamlit(script, port, env_updates):
+    """Process target: run a Streamlit app inside this forked interpreter"""
+    os.environ.update(env_updates)
+    from streamlit.web import bootstrap
+    flag_options = {'server_port': port}
+    bootstrap.load_config_options(flag_options)
+    bootstrap.run(script, False, [], flag_options)
+
+def start_streamlit(script, port, env_updates=None):
+    """Start a Streamlit app, forking from the launcher when the platform allows it"""
+    env_updates = env_updates or {}
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        env = {**os.environ, **env_updates}
+        return subprocess.Popen([sys.executable, "-m", "streamlit", "run", script, f"--server.port={port}"], env=env)
+    
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+    process = multiprocessing.get_context('fork').Process(target=serve_streamlit, args=(script, port, env_updates))
+    process.start()
+    return process
 
 def run_dashboard():
     """Run the Streamlit dashboard"""
@@ -13,16 +58,16 @@ def run_dashboard():
             'dashboard_app.py'            # Fallback to root
         ]
         
-        found_file = None
-        for file in dashboard_files:
-            if os.path.exists(file):
-                found_file = file
-                break
+        found_file = first_existing(dashboard_files)
         
         if found_file:
             print("✅ Starting MCA Insights Dashboard...")
             print("📊 Dashboard will open at http://localhost:8501")
-            subprocess.run([sys.executable, "-m", "streamlit", "run", found_file])
+            env_updates = {}
+            if os.environ.get('MCA_BACKEND') == 'modin':
+                env_updates['MODIN_ENGINE'] = os.environ.get('MODIN_ENGINE', 'dask')
+                print(f"⚡ Using Modin backend ({env_updates['MODIN_ENGINE']} engine)")
+            return start_streamlit(found_file, 8501, env_updates)
         else:
             print("❌ No dashboard file found in dashboard/ folder")
             
@@ -38,16 +83,19 @@ def run_api():
             'api.py'                 # Fallback
         ]
         
-        found_file = None
-        for file in api_files:
-            if os.path.exists(file):
-                found_file = file
-                break
+        found_file = first_existing(api_files)
         
         if found_file:
             print("✅ Starting MCA REST API Server...")
             print("🌐 API will be available at http://localhost:5000")
-            subprocess.run([sys.executable, found_file])
+            api_dir = os.path.dirname(found_file)
+            if os.path.exists(os.path.join(api_dir, 'wsgi.py')) and shutil.which('gunicorn'):
+                # --preload imports the API once so forked workers share the sample data pages
+                workers = str(os.cpu_count() or 1)
+                return subprocess.Popen(["gunicorn", "-w", workers, "-k", "gthread", "--threads", "4",
+                                        "--preload", "-b", "0.0.0.0:5000", "--chdir", api_dir, "wsgi:app"])
+            else:
+                return subprocess.Popen([sys.executable, found_file])
         else:
             print("❌ No API file found in dashboard/ folder")
             
@@ -63,18 +111,12 @@ def run_chatbot():
             'chatbot_app.py'         # Fallback
         ]
         
-        found_file = None
-        for file in chatbot_files:
-            if os.path.exists(file):
-                found_file = file
-                break
+        found_file = first_existing(chatbot_files)
         
         if found_file:
             print("✅ Starting MCA AI Chatbot...")
             print("🤖 Chatbot will open at http://localhost:8502")
-            env = os.environ.copy()
-            env['STREAMLIT_SERVER_PORT'] = '8502'
-            subprocess.run([sys.executable, "-m", "streamlit", "run", found_file, "--server.port=8502"], env=env)
+            return start_streamlit(found_file, 8502, {'STREAMLIT_SERVER_PORT': '8502'})
         else:
             print("❌ No chatbot file found in ai/ folder")
             
@@ -90,24 +132,43 @@ def run_summary():
             'ai/summary_generator.py' # Alternative
         ]
         
-        found_file = None
-        for file in summary_files:
-            if os.path.exists(file):
-                found_file = file
-                break
+        found_file = first_existing(summary_files)
         
         if found_file:
             print("✅ Starting AI Summary Generator...")
             print("📈 Summary Generator will open at http://localhost:8503")
-            env = os.environ.copy()
-            env['STREAMLIT_SERVER_PORT'] = '8503'
-            subprocess.run([sys.executable, "-m", "streamlit", "run", found_file, "--server.port=8503"], env=env)
+            return start_streamlit(found_file, 8503, {'STREAMLIT_SERVER_PORT': '8503'})
         else:
             print("❌ No summary file found in ai/ folder")
             
     except Exception as e:
         print(f"❌ Error starting summary generator: {e}")
 
+def wait_for(processes):
+    """Block until the launched services exit, stopping them all on Ctrl+C"""
+    processes = [process for process in processes if process]
+    try:
+        for process in processes:
+            wait_for_process(process)
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            wait_for_process(process)
+        raise
+
+def wait_for_process(process):
+    # Popen for plain subprocesses, multiprocessing.Process for forked services
+    if isinstance(process, subprocess.Popen):
+        process.wait()
+    else:
+        process.join()
+
+def run_all():
+    """Start every service side by side; each runs in its own server process"""
+    print("🚀 Starting ALL Services...")
+    wait_for([run_dashboard(), run_api(), run_chatbot(), run_summary()])
+
 def main():
     print("🎯 MCA Insights Engine - Interactive Features")
     print("==================================================")
@@ -122,18 +183,15 @@ def main():
         choice = input("Select option (1-5): ").strip()
         
         if choice == "1":
-            run_dashboard()
+            wait_for([run_dashboard()])
         elif choice == "2":
-            run_api()
+            wait_for([run_api()])
         elif choice == "3":
-            run_chatbot()
+            wait_for([run_chatbot()])
         elif choice == "4":
-            run_summary()
+            wait_for([run_summary()])
         elif choice == "5":
-            print("🚀 Starting ALL Services feature is currently under development.")
-            print("Please select individual services (1-4) for now.")
-            print("Exiting...")
-            sys.exit(0)
+            run_all()
         else:
             print("❌ Invalid choice. Please select 1-5.")
             
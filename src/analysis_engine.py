@@ -1,14 +1,41 @@
 import pandas as pd
+import polars as pl
 import numpy as np
 import logging
 import json
 import os
 from datetime import datetime
+from .utils import CATEGORY_COLUMNS, ensure_parquet
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 logger = logging.getLogger(__name__)
 
+# Authorized capital size buckets (left-closed)
+CAPITAL_BREAKS = [100000, 1000000, 10000000]
+CAPITAL_SIZE_LABELS = ['Small (<1L)', 'Medium (1L-10L)', 'Large (10L-1Cr)', 'Very Large (>1Cr)']
+
+def to_lazy(df):
+    """Accept pandas or eager Polars frames for interop; the analyses run on LazyFrames"""
+    if isinstance(df, pd.DataFrame):
+        df = pl.from_pandas(df)
+    df = df.lazy()
+    # Group and count on integer category codes instead of hashing strings
+    columns = df.collect_schema().names()
+    return df.with_columns(pl.col(c).cast(pl.Categorical) for c in CATEGORY_COLUMNS if c in columns)
+
+def capital_summary(column):
+    """Sum, mean, median, max, min and non-null count of a capital column as one struct"""
+    capital = pl.col(column)
+    return pl.struct(
+        capital.sum().alias('sum'),
+        capital.mean().alias('mean'),
+        capital.median().alias('median'),
+        capital.max().alias('max'),
+        capital.min().alias('min'),
+        capital.count().alias('count')
+    ).alias(column)
+
 class AnalysisEngine:
     def __init__(self, config):
         self.config = config
@@ -24,15 +51,72 @@ class AnalysisEngine:
             return None
         
         try:
-            df = pd.read_csv(master_file)
-            logger.info(f"Loaded master dataset: {len(df)} records, {len(df.columns)} columns")
+            # Typed, memory-mapped Parquet scan: each analysis only reads the columns its query projects
+            df = to_lazy(pl.scan_parquet(ensure_parquet(master_file)))
+            logger.info(f"Scanning master dataset: {len(df.collect_schema())} columns")
             return df
         except Exception as e:
             logger.error(f"Error loading master dataset: {str(e)}")
             return None
     
-    def basic_descriptive_analysis(self, df):
+    def collect_aggregates(self, df):
+        """Build every aggregation the analyses report and collect them in one pass"""
+        df = to_lazy(df)
+        columns = df.collect_schema().names()
+        queries = {
+            'total_records': df.select(pl.len()),
+            # Row-wise and cell-wise null counts share one scan of the null masks
+            'data_quality': df.select(
+                pl.any_horizontal(pl.all().is_null()).sum().alias('missing_rows'),
+                pl.sum_horizontal(pl.all().null_count().cast(pl.Int64)).alias('null_cells')
+            )
+        }
+        
+        if 'State' in columns:
+            queries['total_states'] = df.select(pl.col('State').drop_nulls().n_unique())
+            queries['state_counts'] = df.select('State').drop_nulls().group_by('State').len()
+        
+        if 'Company Category' in columns:
+            queries['category_counts'] = df.select('Company Category').drop_nulls().group_by('Company Category').len()
+        
+        # Both capital columns are summarized by one select over a single scan
+        capital_columns = [c for c in ('Authorized Capital', 'Paid-up Capital') if c in columns]
+        if capital_columns:
+            queries['capital_stats'] = df.select(capital_summary(c) for c in capital_columns)
+        
+        if 'Authorized Capital' in columns and 'State' in columns:
+            # No (State, capital) drop_nulls intermediate: the aggregations already skip null
+            # capital, so only null states are filtered and states without any capital dropped
+            capital = pl.col('Authorized Capital')
+            has_state = pl.col('State').is_not_null()
+            queries['state_capital'] = df.filter(has_state).group_by('State').agg([
+                capital.sum().round(2).alias('sum'),
+                capital.mean().round(2).alias('mean'),
+                capital.median().round(2).alias('median'),
+                capital.count().alias('count')
+            ]).filter(pl.col('count') > 0)
+            queries['sized_capital'] = df.select(capital.filter(has_state & (capital >= 0)))
+        
+        if 'Date of Incorporation' in columns:
+            # The Parquet sidecar already stores typed dates; text dates are ISO, possibly with
+            # the time part pandas writes, so parse the date prefix with a fixed format
+            incorporation = pl.col('Date of Incorporation')
+            if not df.collect_schema()['Date of Incorporation'].is_temporal():
+                incorporation = incorporation.cast(pl.String).str.slice(0, 10).str.to_date('%Y-%m-%d', strict=False)
+            
+            # Unparseable dates are dropped
+            queries['years'] = df.select(incorporation.dt.year().alias('year')).drop_nulls()
+        
+        # collect_all runs the queries as one plan, so the shared scan is read once
+        aggregates = dict(zip(queries, pl.collect_all(queries.values(), engine='streaming')))
+        aggregates['columns'] = columns
+        return aggregates
+    
+    def basic_descriptive_analysis(self, df, aggregates=None):
         """Perform basic descriptive analysis"""
+        if aggregates is None:
+            aggregates = self.collect_aggregates(df)
+        columns = aggregates['columns']
         analysis_results = {
             'analysis_timestamp': datetime.now().isoformat(),
             'basic_stats': {},
@@ -43,27 +127,29 @@ class AnalysisEngine:
         }
         
         # Basic statistics - FIXED: Initialize all required keys
-        analysis_results['basic_stats']['total_companies'] = len(df)
-        analysis_results['basic_stats']['total_states'] = df['State'].nunique() if 'State' in df.columns else 0
-        analysis_results['basic_stats']['total_columns'] = len(df.columns)
+        total_records = aggregates['total_records'].item()
+        analysis_results['basic_stats']['total_companies'] = total_records
+        analysis_results['basic_stats']['total_states'] = aggregates['total_states'].item() if 'State' in columns else 0
+        analysis_results['basic_stats']['total_columns'] = len(columns)
         
         # State-wise analysis
-        if 'State' in df.columns:
-            state_stats = df['State'].value_counts().to_dict()
+        if 'State' in columns:
+            state_counts = aggregates['state_counts'].sort('len', descending=True)
+            state_stats = dict(state_counts.iter_rows())
             analysis_results['state_analysis']['company_count_by_state'] = state_stats
             analysis_results['state_analysis']['top_states'] = dict(list(state_stats.items())[:5])
         
         # Capital analysis - FIXED: Handle empty/missing data
-        if 'Authorized Capital' in df.columns:
-            capital_data = df['Authorized Capital'].dropna()
-            if len(capital_data) > 0:
+        if 'Authorized Capital' in columns:
+            capital_data = aggregates['capital_stats'].row(0, named=True)['Authorized Capital']
+            if capital_data['count'] > 0:
                 capital_stats = {
-                    'total_authorized_capital': float(capital_data.sum()),
-                    'average_authorized_capital': float(capital_data.mean()),
-                    'median_authorized_capital': float(capital_data.median()),
-                    'max_authorized_capital': float(capital_data.max()),
-                    'min_authorized_capital': float(capital_data.min()),
-                    'records_with_capital_data': len(capital_data)
+                    'total_authorized_capital': float(capital_data['sum']),
+                    'average_authorized_capital': float(capital_data['mean']),
+                    'median_authorized_capital': float(capital_data['median']),
+                    'max_authorized_capital': float(capital_data['max']),
+                    'min_authorized_capital': float(capital_data['min']),
+                    'records_with_capital_data': capital_data['count']
                 }
             else:
                 capital_stats = {
@@ -76,16 +162,16 @@ class AnalysisEngine:
                 }
             analysis_results['capital_analysis']['authorized_capital'] = capital_stats
         
-        if 'Paid-up Capital' in df.columns:
-            paidup_data = df['Paid-up Capital'].dropna()
-            if len(paidup_data) > 0:
+        if 'Paid-up Capital' in columns:
+            paidup_data = aggregates['capital_stats'].row(0, named=True)['Paid-up Capital']
+            if paidup_data['count'] > 0:
                 paidup_stats = {
-                    'total_paidup_capital': float(paidup_data.sum()),
-                    'average_paidup_capital': float(paidup_data.mean()),
-                    'median_paidup_capital': float(paidup_data.median()),
-                    'max_paidup_capital': float(paidup_data.max()),
-                    'min_paidup_capital': float(paidup_data.min()),
-                    'records_with_paidup_data': len(paidup_data)
+                    'total_paidup_capital': float(paidup_data['sum']),
+                    'average_paidup_capital': float(paidup_data['mean']),
+                    'median_paidup_capital': float(paidup_data['median']),
+                    'max_paidup_capital': float(paidup_data['max']),
+                    'min_paidup_capital': float(paidup_data['min']),
+                    'records_with_paidup_data': paidup_data['count']
                 }
             else:
                 paidup_stats = {
@@ -99,81 +185,82 @@ class AnalysisEngine:
             analysis_results['capital_analysis']['paidup_capital'] = paidup_stats
         
         # Company category analysis
-        if 'Company Category' in df.columns:
-            category_stats = df['Company Category'].value_counts().to_dict()
+        if 'Company Category' in columns:
+            category_counts = aggregates['category_counts'].sort('len', descending=True)
+            category_stats = dict(category_counts.iter_rows())
             analysis_results['company_category_analysis'] = category_stats
         
         # Data quality metrics
+        data_quality = aggregates['data_quality'].row(0, named=True)
+        null_fraction = data_quality['null_cells'] / max(total_records * len(columns), 1)
         analysis_results['data_quality'] = {
-            'total_records': len(df),
-            'records_with_missing_data': df.isna().any(axis=1).sum(),
-            'completeness_percentage': round((1 - df.isna().mean().mean()) * 100, 2)
+            'total_records': total_records,
+            'records_with_missing_data': data_quality['missing_rows'],
+            'completeness_percentage': round((1 - null_fraction) * 100, 2)
         }
         
         return analysis_results
     
-    def advanced_capital_analysis(self, df):
+    def advanced_capital_analysis(self, df, aggregates=None):
         """Perform advanced capital analysis"""
+        if aggregates is None:
+            aggregates = self.collect_aggregates(df)
+        columns = aggregates['columns']
         capital_analysis = {}
         
-        if 'Authorized Capital' in df.columns and 'State' in df.columns:
+        if 'Authorized Capital' in columns and 'State' in columns:
             # State-wise capital analysis - FIXED: Handle empty data
-            capital_data = df[['State', 'Authorized Capital']].dropna()
-            if len(capital_data) > 0:
-                state_capital = capital_data.groupby('State')['Authorized Capital'].agg([
-                    'sum', 'mean', 'median', 'count'
-                ]).round(2)
-                
+            state_capital = aggregates['state_capital'].sort('State')
+            if len(state_capital) > 0:
                 # Convert to dictionary format
-                capital_analysis['state_wise_capital'] = state_capital.to_dict('index')
-                
-                # Capital distribution analysis
-                capital_bins = [0, 100000, 1000000, 10000000, float('inf')]
-                bin_labels = ['Small (<1L)', 'Medium (1L-10L)', 'Large (10L-1Cr)', 'Very Large (>1Cr)']
+                capital_analysis['state_wise_capital'] = {
+                    row.pop('State'): row for row in state_capital.iter_rows(named=True)
+                }
                 
-                capital_data['Capital_Size_Category'] = pd.cut(
-                    capital_data['Authorized Capital'], 
-                    bins=capital_bins, 
-                    labels=bin_labels,
-                    right=False
+                # Capital distribution analysis; empty buckets are reported too, largest bucket first
+                capital_values = aggregates['sized_capital'].to_series().to_numpy()
+                # Left-closed buckets: searchsorted(side='right') counts the breaks at or below each value
+                size_index = np.searchsorted(CAPITAL_BREAKS, capital_values, side='right')
+                size_counts = np.bincount(size_index, minlength=len(CAPITAL_SIZE_LABELS))
+                capital_distribution = dict(zip(CAPITAL_SIZE_LABELS, size_counts.tolist()))
+                capital_analysis['capital_size_distribution'] = dict(
+                    sorted(capital_distribution.items(), key=lambda item: -item[1])
                 )
-                
-                capital_distribution = capital_data['Capital_Size_Category'].value_counts().to_dict()
-                capital_analysis['capital_size_distribution'] = capital_distribution
             else:
                 capital_analysis['state_wise_capital'] = {}
                 capital_analysis['capital_size_distribution'] = {}
         
         return capital_analysis
     
-    def temporal_analysis(self, df):
+    def temporal_analysis(self, df, aggregates=None):
         """Analyze trends over time"""
+        if aggregates is None:
+            aggregates = self.collect_aggregates(df)
         temporal_analysis = {}
         
-        if 'Date of Incorporation' in df.columns:
-            # Convert to datetime if not already
-            df['Year_of_Incorporation'] = pd.to_datetime(
-                df['Date of Incorporation'], errors='coerce'
-            ).dt.year
+        if 'Date of Incorporation' in aggregates['columns']:
+            years = aggregates['years'].to_series().to_numpy()
             
-            # Remove NaN years
-            valid_years = df['Year_of_Incorporation'].dropna()
-            
-            if len(valid_years) > 0:
-                # Year-wise company registration
-                yearly_registrations = valid_years.value_counts().sort_index().to_dict()
+            if len(years) > 0:
+                # Year-wise company registration: years span a small integer range, so a
+                # bincount offset by the earliest year replaces hashing and sorting
+                first_year = int(years.min())
+                year_counts = np.bincount(years - first_year)
+                yearly_registrations = {
+                    first_year + int(offset): int(year_counts[offset]) for offset in np.flatnonzero(year_counts)
+                }
                 temporal_analysis['yearly_registrations'] = yearly_registrations
                 
                 # Recent trends (last 10 years)
                 current_year = datetime.now().year
-                recent_years = {int(k): int(v) for k, v in yearly_registrations.items() 
-                              if k >= current_year - 10 and pd.notna(k)}
+                recent_years = {k: v for k, v in yearly_registrations.items() 
+                              if k >= current_year - 10}
                 temporal_analysis['recent_trends'] = recent_years
                 
                 # Overall trend statistics
                 temporal_analysis['trend_stats'] = {
-                    'earliest_year': int(valid_years.min()),
-                    'latest_year': int(valid_years.max()),
+                    'earliest_year': min(yearly_registrations),
+                    'latest_year': max(yearly_registrations),
                     'total_years_covered': len(yearly_registrations)
                 }
             else:
@@ -290,21 +377,29 @@ class AnalysisEngine:
         try:
             # Load data
             df = self.load_master_data()
-            if df is None or df.empty:
+            if df is None:
+                logger.error("❌ No data available for analysis")
+                return False
+            
+            # All three analyses slice their sections from one fused aggregation pass
+            logger.info("🧮 Aggregating master dataset...")
+            aggregates = self.collect_aggregates(df)
+            total_records = aggregates['total_records'].item()
+            if total_records == 0:
                 logger.error("❌ No data available for analysis")
                 return False
             
-            logger.info(f"📊 Dataset loaded: {len(df)} records, {len(df.columns)} columns")
+            logger.info(f"📊 Dataset loaded: {total_records} records, {len(aggregates['columns'])} columns")
             
             # Perform analyses
             logger.info("📈 Performing basic descriptive analysis...")
-            basic_analysis = self.basic_descriptive_analysis(df)
+            basic_analysis = self.basic_descriptive_analysis(df, aggregates)
             
             logger.info("💰 Performing capital analysis...")
-            capital_analysis = self.advanced_capital_analysis(df)
+            capital_analysis = self.advanced_capital_analysis(df, aggregates)
             
             logger.info("📅 Performing temporal analysis...")
-            temporal_analysis = self.temporal_analysis(df)
+            temporal_analysis = self.temporal_analysis(df, aggregates)
             
             # Combine all analyses - FIXED: Proper structure
             analysis_results = {
@@ -313,7 +408,7 @@ class AnalysisEngine:
                 'temporal_analysis': temporal_analysis,
                 'analysis_metadata': {
                     'timestamp': datetime.now().isoformat(),
-                    'total_records_analyzed': len(df),
+                    'total_records_analyzed': total_records,
                     'analysis_version': '1.0'
                 }
             }
@@ -330,7 +425,7 @@ class AnalysisEngine:
                 logger.info("🎉 Analysis Pipeline Completed Successfully!")
                 # Print summary
                 print(f"\n📊 ANALYSIS SUMMARY:")
-                print(f"   Companies Analyzed: {len(df):,}")
+                print(f"   Companies Analyzed: {total_records:,}")
                 print(f"   States Covered: {basic_analysis['basic_stats']['total_states']}")
                 print(f"   Data Completeness: {basic_analysis['data_quality']['completeness_percentage']}%")
                 print(f"   Key Insights Generated: {len(insights['key_findings'])}")
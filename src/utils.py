@@ -1,11 +1,16 @@
 import os
 import pandas as pd
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 import logging
 from datetime import datetime
 import yaml
 import json
 import sys
 
+# Low-cardinality columns the analyses group and count by
+CATEGORY_COLUMNS = ['State', 'Company Category']
+
 def setup_logging(log_level='INFO', log_file=None):
     """Setup logging configuration"""
     if log_file is None:
@@ -163,6 +168,22 @@ def load_json(file_path):
         logging.error(f"Error loading JSON from {file_path}: {e}")
         return None
 
+def ensure_parquet(csv_path):
+    """Convert a CSV to a zstd Parquet sidecar once, reconverting only when the CSV is newer"""
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path):
+        # Empty string cells become nulls, as pandas and Polars read them
+        convert_options = pv.ConvertOptions(strings_can_be_null=True)
+        table = pv.read_csv(csv_path, convert_options=convert_options)
+        # Dictionary-encoded group keys load straight back as categoricals
+        for column in CATEGORY_COLUMNS:
+            if column in table.column_names:
+                index = table.schema.get_field_index(column)
+                table = table.set_column(index, column, table.column(column).dictionary_encode())
+        pq.write_table(table, parquet_path, compression='zstd')
+        logging.info(f"Cached master dataset as Parquet: {parquet_path}")
+    return parquet_path
+
 def check_file_exists(file_path):
     """Check if file exists and return size info"""
     if os.path.exists(file_path):